@@ -1,6 +1,6 @@
 """Database package for the PDF to Excel converter."""
 
-from .models import Base, ProcessingJobDB, ExtractedTextDB, ExtractedTableDB, PDFMetadataDB
+from .models import Base, ProcessingJobDB, ExtractedTextDB, ExtractedTableDB, PDFMetadataDB, StatsCacheDB
 from .manager import DatabaseManager
 
 __all__ = [
@@ -9,5 +9,6 @@ __all__ = [
     "ExtractedTextDB", 
     "ExtractedTableDB", 
     "PDFMetadataDB",
+    "StatsCacheDB",
     "DatabaseManager"
 ] 
\ No newline at end of file
@@ -9,12 +9,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from sqlalchemy import create_engine, text
-    from sqlalchemy.orm import sessionmaker, Session
+    from sqlalchemy import column, create_engine, func, literal_column, table, text
+    from sqlalchemy.orm import joinedload, sessionmaker, Session
     from sqlalchemy.exc import SQLAlchemyError
 except ImportError:
+    column = None
     create_engine = None
+    func = None
+    literal_column = None
+    table = None
     text = None
+    joinedload = None
     sessionmaker = None
     Session = None
     SQLAlchemyError = None
@@ -24,9 +29,31 @@ from ..models import ProcessingJob, ProcessingResult
 from ..utils import calculate_file_hash
 from .models import (
     Base, ProcessingJobDB, ExtractedTextDB, ExtractedTableDB, 
-    PDFMetadataDB, ProcessingSessionDB, FileHashDB
+    PDFMetadataDB, ProcessingSessionDB, FileHashDB, StatsCacheDB
 )
 
+# SQLite FTS5 index over extracted_text.text_content. The trigram tokenizer
+# matches arbitrary substrings (like LIKE '%term%') of three or more characters;
+# triggers keep the external-content index in sync with the table.
+_FTS_TABLE_NAME = "extracted_text_fts"
+_FTS_SETUP_SQL = (
+    f"CREATE VIRTUAL TABLE {_FTS_TABLE_NAME} USING fts5("
+    f"text_content, content='extracted_text', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER {_FTS_TABLE_NAME}_ai AFTER INSERT ON extracted_text BEGIN "
+    f"INSERT INTO {_FTS_TABLE_NAME}(rowid, text_content) VALUES (new.id, new.text_content); END",
+    f"CREATE TRIGGER {_FTS_TABLE_NAME}_ad AFTER DELETE ON extracted_text BEGIN "
+    f"INSERT INTO {_FTS_TABLE_NAME}({_FTS_TABLE_NAME}, rowid, text_content) "
+    f"VALUES ('delete', old.id, old.text_content); END",
+    f"CREATE TRIGGER {_FTS_TABLE_NAME}_au AFTER UPDATE ON extracted_text BEGIN "
+    f"INSERT INTO {_FTS_TABLE_NAME}({_FTS_TABLE_NAME}, rowid, text_content) "
+    f"VALUES ('delete', old.id, old.text_content); "
+    f"INSERT INTO {_FTS_TABLE_NAME}(rowid, text_content) VALUES (new.id, new.text_content); END",
+    # Index any rows stored before the FTS table existed
+    f"INSERT INTO {_FTS_TABLE_NAME}({_FTS_TABLE_NAME}) VALUES ('rebuild')",
+)
+_FTS_MIN_TERM_LENGTH = 3
+_SNIPPET_LENGTH = 100
+
 
 class DatabaseManager:
     """Manages database operations for PDF processing."""
@@ -44,6 +71,7 @@ class DatabaseManager:
         self.database_url = database_url
         self.engine = None
         self.SessionLocal = None
+        self.fts_enabled = False
         self._initialize_database()
     
     def _initialize_database(self) -> None:
@@ -59,6 +87,14 @@ class DatabaseManager:
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
             
+            # create_all skips tables that already exist, so add any indexes
+            # introduced since the database was created
+            for db_table in Base.metadata.sorted_tables:
+                for index in db_table.indexes:
+                    index.create(bind=self.engine, checkfirst=True)
+            
+            self.fts_enabled = self._initialize_fts()
+            
             # Create session factory
             self.SessionLocal = sessionmaker(
                 autocommit=False,
@@ -70,6 +106,29 @@ class DatabaseManager:
             print(f"Database initialization error: {e}")
             raise
     
+    def _initialize_fts(self) -> bool:
+        """Create the full-text index over extracted text if it does not exist yet.
+        
+        Returns:
+            True if full-text search is available (SQLite with FTS5)
+        """
+        if self.engine.dialect.name != "sqlite":
+            return False
+        
+        try:
+            with self.engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": _FTS_TABLE_NAME}
+                ).first()
+                if exists is None:
+                    for statement in _FTS_SETUP_SQL:
+                        conn.execute(text(statement))
+            return True
+        except SQLAlchemyError as e:
+            print(f"Full-text search unavailable, falling back to LIKE: {e}")
+            return False
+    
     def get_session(self) -> Session:
         """Get a database session."""
         if self.SessionLocal is None:
@@ -153,6 +212,9 @@ class DatabaseManager:
                 if existing_hash:
                     existing_hash.last_job_id = job_db.id
                 
+                # Cached statistics no longer reflect the stored data
+                self.invalidate_stats(session)
+                
                 session.commit()
                 return job_db.id
                 
@@ -210,7 +272,7 @@ class DatabaseManager:
         """Save extracted text to database."""
         try:
             for text_block in text_data.get("text_blocks", []):
-                text_content = text_block.get("text", "")
+                text_content = text_block.text
                 
                 # Analyze text content
                 word_count = len(text_content.split())
@@ -225,7 +287,7 @@ class DatabaseManager:
                 
                 text_db = ExtractedTextDB(
                     job_id=job_id,
-                    page_number=text_block.get("page", 1),
+                    page_number=text_block.page,
                     text_content=text_content,
                     text_length=len(text_content),
                     word_count=word_count,
@@ -357,34 +419,88 @@ class DatabaseManager:
                 ProcessingJobDB.created_at.desc()
             ).limit(limit).all()
     
-    def get_job_statistics(self) -> Dict[str, Any]:
-        """Get processing statistics."""
-        with self.get_session() as session:
-            total_jobs = session.query(ProcessingJobDB).count()
-            completed_jobs = session.query(ProcessingJobDB).filter_by(status="completed").count()
-            failed_jobs = session.query(ProcessingJobDB).filter_by(status="failed").count()
-            
-            total_files = session.query(FileHashDB).count()
-            total_text_blocks = session.query(ExtractedTextDB).count()
-            total_tables = session.query(ExtractedTableDB).count()
-            
-            return {
-                "total_jobs": total_jobs,
-                "completed_jobs": completed_jobs,
-                "failed_jobs": failed_jobs,
-                "success_rate": (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0,
-                "total_files_processed": total_files,
-                "total_text_blocks": total_text_blocks,
-                "total_tables": total_tables
-            }
+    def get_job_statistics(self, session: Optional[Session] = None) -> Dict[str, Any]:
+        """Get processing statistics.
+        
+        Args:
+            session: Session to query with; a new one is opened if None
+        """
+        if session is None:
+            with self.get_session() as own_session:
+                return self.get_job_statistics(own_session)
+        
+        total_jobs = session.query(ProcessingJobDB).count()
+        completed_jobs = session.query(ProcessingJobDB).filter_by(status="completed").count()
+        failed_jobs = session.query(ProcessingJobDB).filter_by(status="failed").count()
+        
+        total_files = session.query(FileHashDB).count()
+        total_text_blocks = session.query(ExtractedTextDB).count()
+        total_tables = session.query(ExtractedTableDB).count()
+        
+        return {
+            "total_jobs": total_jobs,
+            "completed_jobs": completed_jobs,
+            "failed_jobs": failed_jobs,
+            "success_rate": (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0,
+            "total_files_processed": total_files,
+            "total_text_blocks": total_text_blocks,
+            "total_tables": total_tables
+        }
     
     def search_text_content(self, search_term: str, limit: int = 50) -> List[ExtractedTextDB]:
-        """Search for text content containing the search term."""
+        """Search for text content containing the search term.
+        
+        Each result's job is loaded in the same query, so it stays readable
+        after the session closes.
+        """
         with self.get_session() as session:
-            return session.query(ExtractedTextDB).filter(
+            return session.query(ExtractedTextDB).options(
+                joinedload(ExtractedTextDB.job)
+            ).filter(
                 ExtractedTextDB.text_content.contains(search_term)
             ).limit(limit).all()
     
+    def search_fts(self, search_term: str, limit: int = 10) -> List[Tuple[ExtractedTextDB, str]]:
+        """Search text content through the full-text index.
+        
+        Terms shorter than three characters, or databases without FTS5, fall
+        back to search_text_content.
+        
+        Returns:
+            List of (text record, snippet) pairs; each record's job is loaded
+        """
+        if not self.fts_enabled or len(search_term) < _FTS_MIN_TERM_LENGTH:
+            return [
+                (result, self._make_snippet(result.text_content))
+                for result in self.search_text_content(search_term, limit=limit)
+            ]
+        
+        fts = table(_FTS_TABLE_NAME, column("rowid"))
+        fts_column = literal_column(_FTS_TABLE_NAME)
+        # Quote the term as an FTS5 phrase so punctuation is matched literally
+        phrase = '"' + search_term.replace('"', '""') + '"'
+        
+        with self.get_session() as session:
+            return [
+                tuple(row) for row in session.query(
+                    ExtractedTextDB,
+                    func.snippet(fts_column, 0, "", "", "...", 64)
+                ).options(
+                    joinedload(ExtractedTextDB.job)
+                ).join(
+                    fts, fts.c.rowid == ExtractedTextDB.id
+                ).filter(
+                    fts_column.op("MATCH")(phrase)
+                ).order_by(ExtractedTextDB.id).limit(limit).all()
+            ]
+    
+    @staticmethod
+    def _make_snippet(text_content: str) -> str:
+        """Shorten text content for display."""
+        if len(text_content) > _SNIPPET_LENGTH:
+            return text_content[:_SNIPPET_LENGTH] + "..."
+        return text_content
+    
     def get_duplicate_files(self) -> List[FileHashDB]:
         """Get files that have been processed multiple times."""
         with self.get_session() as session:
@@ -392,6 +508,48 @@ class DatabaseManager:
                 FileHashDB.processing_count > 1
             ).order_by(FileHashDB.processing_count.desc()).all()
     
+    def get_cached_stats(self, session: Session, key: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """Get cached statistics for a key.
+        
+        Args:
+            session: Session to read the cache with
+            key: Statistics name
+            max_age: Maximum age of the cached entry in seconds
+        
+        Returns:
+            The cached statistics, or None if missing or older than max_age
+        """
+        entry = session.get(StatsCacheDB, key)
+        if entry is None or datetime.now() - entry.computed_at > timedelta(seconds=max_age):
+            return None
+        return entry.value_json
+    
+    def store_cached_stats(self, session: Session, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Store computed statistics in the cache and commit.
+        
+        Args:
+            session: Session to write the cache with
+            entries: Statistics by name
+        """
+        computed_at = datetime.now()
+        for key, value in entries.items():
+            session.merge(StatsCacheDB(key=key, value_json=value, computed_at=computed_at))
+        session.commit()
+    
+    def invalidate_stats(self, session: Optional[Session] = None) -> None:
+        """Drop all cached statistics.
+        
+        Called whenever processing data changes. With a session, the delete
+        joins that session's transaction; otherwise it is committed on its own.
+        """
+        if session is not None:
+            session.query(StatsCacheDB).delete()
+            return
+        
+        with self.get_session() as own_session:
+            own_session.query(StatsCacheDB).delete()
+            own_session.commit()
+    
     def cleanup_old_data(self, days: int = 30) -> int:
         """Clean up old processing data."""
         cutoff_date = datetime.now() - timedelta(days=days)
@@ -403,6 +561,9 @@ class DatabaseManager:
                     ProcessingJobDB.created_at < cutoff_date
                 ).delete()
                 
+                if deleted_count:
+                    self.invalidate_stats(session)
+                
                 session.commit()
                 return deleted_count
                 
@@ -47,6 +47,7 @@ class ProcessingJobDB(Base):
     __table_args__ = (
         Index('idx_job_status', 'status'),
         Index('idx_job_created', 'created_at'),
+        Index('idx_job_file_created', 'input_file_name', 'created_at'),
         Index('idx_file_hash', 'input_file_hash'),
     )
 
@@ -160,4 +161,11 @@ class ProcessingSessionDB(Base):
     __table_args__ = (
         Index('idx_session_status', 'status'),
         Index('idx_session_created', 'created_at'),
-    ) 
\ No newline at end of file
+    ) 
+
+class StatsCacheDB(Base):
+    __tablename__ = "stats_cache"
+
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value_json: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -139,6 +139,14 @@ class ProcessingJob(BaseModel):
         return self.status in [ProcessingStatus.PENDING, ProcessingStatus.PROCESSING]
 
 
+class TextBlock(NamedTuple):
+    """Text extracted from a single PDF page."""
+    
+    page: int
+    text: str
+    length: int
+
+
 class ProcessingResult(BaseModel):
     """Result of PDF processing."""
     
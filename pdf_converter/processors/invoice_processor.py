@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
@@ -11,6 +14,79 @@ import pandas as pd
 from ..models import ProcessingJob, ProcessingResult, ProcessingStatus
 from .base import BaseProcessor
 
+# Prefer RE2 (google-re2) when installed: every pattern below is a plain
+# regular expression, so it can run on RE2's DFA instead of the backtracking
+# engine. Flags are written inline because RE2's module API takes no flag
+# arguments.
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+_CUSTOMER_ID_RE = _re.compile(r'(?i)Customer\s*#\s*(\d+)')
+_SALES_ORDER_RE = _re.compile(r'(?i)Sales\s*Order\s*#\s*(\d+)')
+_CUSTOMER_PO_RE = _re.compile(r'(?i)Customer\s*PO\s*([A-Z0-9]+)')
+_INT_RE = _re.compile(r'(\d+)')
+_DECIMAL_RE = _re.compile(r'(\d+\.?\d*)')
+_CARTONS_RE = _re.compile(r'(?i)No\.\s*of\s*Cartons\s*(\d+)')
+_GROSS_WEIGHT_RE = _re.compile(r'(?is)Gross\s*Weight\s*:?.*?(\d+\.?\d*)\s*LB')
+_NET_WEIGHT_RE = _re.compile(r'(?is)Net\s*Weight\s*:?.*?(\d+\.?\d*)\s*LB')
+_DATE_RE = _re.compile(r'(?i)Date\s+(\d{2}/\d{2}/\d{4})')
+_DELIVERY_RE = _re.compile(r'(?i)Delivery\s*#\s*(\d+)')
+_DUN_RE = _re.compile(r'(?i)DUN#(\d+)')
+# Carton/weight labels inside table cells, matched on ASCII bytes
+_CELL_LABEL_RE = _re.compile(rb'(?i)NO\. OF CARTONS|GROSS WEIGHT|NET WEIGHT')
+
+# Header and summary rows that are never line items
+_SKIP_ROW_PATTERNS = [
+    _re.compile(r'(?i)^Style-Color$'),
+    _re.compile(r'(?i)^Description$'),
+    _re.compile(r'(?i)^Size$'),
+    _re.compile(r'(?i)^Qty$'),
+    _re.compile(r'(?i)^Total$'),
+    _re.compile(r'(?i)^Subtotal$'),
+    _re.compile(r'(?i)^Tax$'),
+    _re.compile(r'(?i)^Grand Total$'),
+]
+
+# Indicators of line item content
+_LINE_ITEM_PATTERNS = [
+    _re.compile(r'\d{6}-\d{3}'),  # Style code pattern (6 digits - 3 digits)
+    _re.compile(r'(?i)Size\s+[A-Z0-9]+'),  # Size specification
+    _re.compile(r'(?i)Main Body:'),  # Material specification
+    _re.compile(r'(?i)Trim\s*\d*:'),  # Trim specification
+    _re.compile(r'(?i)Lining:'),  # Lining specification
+    _re.compile(r'(?i)Country of Origin:'),  # Origin specification
+    _re.compile(r'(?i)Tariff code:'),  # Tariff specification
+]
+
+_ITEM_QTY_RE = _re.compile(r'^\s*(\d+)')
+_ITEM_STYLE_RE = _re.compile(r'(\d{6}-\d{3})')
+_ITEM_SIZE_RE = _re.compile(r'(?i)Size\s+([A-Z0-9]+)')
+_EDGE_PUNCT_RE = _re.compile(r'^[-:\s]+|[-:\s]+$')
+_MAIN_BODY_RE = _re.compile(r'(?i)Main Body\s*:\s*([^;\n]+)')
+_TRIM_RE = _re.compile(r'(?i)Trim\s*\d*\s*:\s*([^;\n]+)')
+_LINING_RE = _re.compile(r'(?i)Lining\s*:\s*([^;\n]+)')
+_COUNTRY_RE = _re.compile(r'(?i)Country of Origin:\s*([A-Z]{2,})')
+_TARIFF_RE = _re.compile(r'(?i)Tariff code:\s*(\d+\.\d+\.\d+)')
+
+
+def _clean_desc(text: str) -> str:
+    """Remove leading and trailing dashes, colons and whitespace from a description."""
+    return _EDGE_PUNCT_RE.sub('', text.strip())
+
+
+def _process_one(
+    extracted_data: Dict[str, Any], metadata: Dict[str, Any], config: Dict[str, Any]
+) -> pd.DataFrame:
+    """Transform a single invoice in a worker process.
+
+    Kept at module level so it can be pickled by ProcessPoolExecutor. The
+    worker's processor is built from the parent's config, so parallel and
+    serial runs behave the same.
+    """
+    return InvoiceProcessor(config).transform_to_structured_format(extracted_data, metadata)
+
 
 class InvoiceProcessor(BaseProcessor):
     """Specialized processor for extracting structured invoice data.
@@ -45,9 +121,6 @@ class InvoiceProcessor(BaseProcessor):
     
     def transform_to_structured_format(self, extracted_data: Dict[str, Any], metadata: Dict[str, Any]) -> pd.DataFrame:
         """Transform raw extracted data into structured invoice format."""
-        # Initialize empty DataFrame with required columns
-        df = pd.DataFrame(columns=self.required_columns)
-        
         # Extract data from tables and text
         tables = extracted_data.get("tables", {}).get("tables", [])
         text_data = extracted_data.get("text", {})
@@ -62,17 +135,59 @@ class InvoiceProcessor(BaseProcessor):
         if not line_items:
             line_items = self._extract_line_items_from_text(text_data)
         
-        # Create structured records
-        records = []
-        for item in line_items:
-            record = header_info.copy()
-            record.update(item)
-            records.append(record)
+        if not line_items:
+            return pd.DataFrame(columns=self.required_columns)
+        
+        # Build columns directly: broadcast each header value to every row,
+        # then overwrite only the fields each line item provides
+        n = len(line_items)
+        columns = {col: [header_info.get(col)] * n for col in self.required_columns}
+        for i, item in enumerate(line_items):
+            for key, value in item.items():
+                column = columns.get(key)
+                if column is not None:
+                    column[i] = value
+        
+        return pd.DataFrame(columns, columns=self.required_columns)
+    
+    def transform_batch(
+        self,
+        jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        parallel: bool = True
+    ) -> pd.DataFrame:
+        """Transform many invoices and concatenate them into one DataFrame.
+        
+        Args:
+            jobs: List of (extracted_data, metadata) pairs
+            max_workers: Number of worker processes (defaults to CPU count)
+            parallel: Fan out across processes; set False to run serially
+            
+        Returns:
+            Structured DataFrame with the line items of all invoices
+        """
+        if not jobs:
+            return pd.DataFrame(columns=self.required_columns)
         
-        if records:
-            df = pd.DataFrame(records)
+        extracted_list = [extracted for extracted, _ in jobs]
+        meta_list = [meta for _, meta in jobs]
         
-        return df
+        if parallel and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(
+                    _process_one, extracted_list, meta_list, repeat(self.config), chunksize=4
+                ))
+        else:
+            frames = [
+                self.transform_to_structured_format(extracted, meta)
+                for extracted, meta in zip(extracted_list, meta_list)
+            ]
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=self.required_columns)
+        
+        return pd.concat(frames, ignore_index=True)
     
     def _extract_header_info(self, tables: List[Dict], text_data: Dict) -> Dict[str, Any]:
         """Extract header information from invoice, using both tables and text."""
@@ -100,15 +215,15 @@ class InvoiceProcessor(BaseProcessor):
 
         # --- Fallback to text extraction if not found in tables ---
         if not header_info['customer_id']:
-            customer_match = re.search(r'Customer\s*#\s*(\d+)', full_text, re.IGNORECASE)
+            customer_match = _CUSTOMER_ID_RE.search(full_text)
             if customer_match:
                 header_info['customer_id'] = customer_match.group(1)
         if not header_info['sales_order_id']:
-            so_match = re.search(r'Sales\s*Order\s*#\s*(\d+)', full_text, re.IGNORECASE)
+            so_match = _SALES_ORDER_RE.search(full_text)
             if so_match:
                 header_info['sales_order_id'] = so_match.group(1)
         if not header_info['customer_po']:
-            po_match = re.search(r'Customer\s*PO\s*([A-Z0-9]+)', full_text, re.IGNORECASE)
+            po_match = _CUSTOMER_PO_RE.search(full_text)
             if po_match:
                 header_info['customer_po'] = po_match.group(1)
 
@@ -118,9 +233,13 @@ class InvoiceProcessor(BaseProcessor):
             data = table.get("data", [])
             for row in data:
                 for idx, cell in enumerate(row):
-                    cell_str = str(cell).strip().upper()
+                    cell_bytes = str(cell).strip().encode('ascii', 'ignore')
+                    found = _CELL_LABEL_RE.findall(cell_bytes)
+                    if not found:
+                        continue
+                    labels = {label.upper() for label in found}
                     # Cartons count
-                    if "NO. OF CARTONS" in cell_str:
+                    if b"NO. OF CARTONS" in labels:
                         value = None
                         if idx+1 < len(row):
                             value = str(row[idx+1]).strip()
@@ -129,11 +248,11 @@ class InvoiceProcessor(BaseProcessor):
                             if next_row:
                                 value = str(next_row[0]).strip()
                         if value:
-                            num_match = re.search(r'(\d+)', value.replace(',', ''))
+                            num_match = _INT_RE.search(value.replace(',', ''))
                             if num_match:
                                 header_info['cartons_count'] = int(num_match.group(1))
                     # Gross weight
-                    if "GROSS WEIGHT" in cell_str:
+                    if b"GROSS WEIGHT" in labels:
                         value = None
                         if idx+1 < len(row):
                             value = str(row[idx+1]).strip()
@@ -141,11 +260,11 @@ class InvoiceProcessor(BaseProcessor):
                             next_row = data[data.index(row)+1]
                             value = str(next_row[0]).strip()
                         if value:
-                            num_match = re.search(r'(\d+\.?\d*)', value.replace(',', ''))
+                            num_match = _DECIMAL_RE.search(value.replace(',', ''))
                             if num_match:
                                 header_info['cartons_gross_weight'] = float(num_match.group(1))
                     # Net weight
-                    if "NET WEIGHT" in cell_str:
+                    if b"NET WEIGHT" in labels:
                         value = None
                         if idx+1 < len(row):
                             value = str(row[idx+1]).strip()
@@ -153,26 +272,26 @@ class InvoiceProcessor(BaseProcessor):
                             next_row = data[data.index(row)+1]
                             value = str(next_row[0]).strip()
                         if value:
-                            num_match = re.search(r'(\d+\.?\d*)', value.replace(',', ''))
+                            num_match = _DECIMAL_RE.search(value.replace(',', ''))
                             if num_match:
                                 header_info['cartons_net_weight'] = float(num_match.group(1))
         # Fallback to text for cartons_count
         if not header_info['cartons_count']:
-            carton_match = re.search(r'No\.\s*of\s*Cartons\s*(\d+)', full_text, re.IGNORECASE)
+            carton_match = _CARTONS_RE.search(full_text)
             if carton_match:
                 header_info['cartons_count'] = int(carton_match.group(1))
         # Fallback to text for weights
         if not header_info['cartons_gross_weight']:
-            gross_match = re.search(r'Gross\s*Weight\s*:?.*?(\d+\.?\d*)\s*LB', full_text, re.IGNORECASE|re.DOTALL)
+            gross_match = _GROSS_WEIGHT_RE.search(full_text)
             if gross_match:
                 header_info['cartons_gross_weight'] = float(gross_match.group(1))
         if not header_info['cartons_net_weight']:
-            net_match = re.search(r'Net\s*Weight\s*:?.*?(\d+\.?\d*)\s*LB', full_text, re.IGNORECASE|re.DOTALL)
+            net_match = _NET_WEIGHT_RE.search(full_text)
             if net_match:
                 header_info['cartons_net_weight'] = float(net_match.group(1))
 
         # --- Transaction date ---
-        date_match = re.search(r'Date\s+(\d{2}/\d{2}/\d{4})', full_text, re.IGNORECASE)
+        date_match = _DATE_RE.search(full_text)
         if date_match:
             date_str = date_match.group(1)
             try:
@@ -184,15 +303,21 @@ class InvoiceProcessor(BaseProcessor):
             header_info['transaction_date'] = '9999-12-31'
 
         # --- Delivery ID, DUN ID, etc. ---
-        delivery_match = re.search(r'Delivery\s*#\s*(\d+)', full_text, re.IGNORECASE)
+        delivery_match = _DELIVERY_RE.search(full_text)
         if delivery_match:
             header_info['delivery_id'] = delivery_match.group(1)
-        dun_match = re.search(r'DUN#(\d+)', full_text, re.IGNORECASE)
+        dun_match = _DUN_RE.search(full_text)
         if dun_match:
             header_info['dun_id'] = dun_match.group(1)
 
         # --- Address extraction (refined) ---
-        self._extract_address_info(full_text, header_info)
+        invoice_to, sold_to, ship_to = self._extract_address_info(full_text)
+        if invoice_to:
+            header_info['invoice_to'] = invoice_to
+        if sold_to:
+            header_info['sold_to'] = sold_to
+        if ship_to:
+            header_info['ship_to'] = ship_to
         return header_info
 
     def _extract_line_items(self, tables: List[Dict], text_data: Dict) -> List[Dict[str, Any]]:
@@ -280,40 +405,20 @@ class InvoiceProcessor(BaseProcessor):
             return False
         
         # Skip header rows and summary rows
-        skip_patterns = [
-            r'^Style-Color$',  # Header row
-            r'^Description$',  # Header row
-            r'^Size$',  # Header row
-            r'^Qty$',  # Header row
-            r'^Total$',  # Summary row
-            r'^Subtotal$',  # Summary row
-            r'^Tax$',  # Summary row
-            r'^Grand Total$',  # Summary row
-        ]
-        
-        for pattern in skip_patterns:
-            if re.match(pattern, row_text, re.IGNORECASE):
+        for pattern in _SKIP_ROW_PATTERNS:
+            if pattern.match(row_text):
                 return False
         
-        # Look for patterns that indicate line items
-        positive_patterns = [
-            r'\d{6}-\d{3}',  # Style code pattern (6 digits - 3 digits)
-            r'Size\s+[A-Z0-9]+',  # Size specification
-            r'Main Body:',  # Material specification
-            r'Trim\s*\d*:',  # Trim specification
-            r'Lining:',  # Lining specification
-            r'Country of Origin:',  # Origin specification
-            r'Tariff code:',  # Tariff specification
-        ]
-        
-        # Count how many positive patterns match
+        # Must have at least 2 positive indicators to be considered a line item,
+        # so stop scanning as soon as the second one matches
         matches = 0
-        for pattern in positive_patterns:
-            if re.search(pattern, row_text, re.IGNORECASE):
+        for pattern in _LINE_ITEM_PATTERNS:
+            if pattern.search(row_text):
                 matches += 1
+                if matches >= 2:
+                    return True
         
-        # Must have at least 2 positive indicators to be considered a line item
-        return matches >= 2
+        return False
     
     def _parse_line_item(self, row: List[str], headers: List[str]) -> Optional[Dict[str, Any]]:
         """Parse a single line item row."""
@@ -349,8 +454,16 @@ class InvoiceProcessor(BaseProcessor):
         
         return item if item else None
     
-    def _extract_address_info(self, full_text: str, header_info: Dict[str, Any]) -> None:
-        """Extract address information from the invoice text, ensuring no mixing of address blocks."""
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _extract_address_info(full_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Extract address information from the invoice text, ensuring no mixing of address blocks.
+        
+        Pure function of the text, memoized so reprocessing the same invoice skips the scan.
+        
+        Returns:
+            Tuple of (invoice_to, sold_to, ship_to), None for blocks not found
+        """
         lines = full_text.split('\n')
         invoice_to, sold_to, ship_to = [], [], []
         current = None
@@ -370,12 +483,11 @@ class InvoiceProcessor(BaseProcessor):
                 continue
             if current is not None and l:
                 current.append(l)
-        if invoice_to:
-            header_info['invoice_to'] = ' '.join(invoice_to)
-        if sold_to:
-            header_info['sold_to'] = ' '.join(sold_to)
-        if ship_to:
-            header_info['ship_to'] = ' '.join(ship_to)
+        return (
+            ' '.join(invoice_to) if invoice_to else None,
+            ' '.join(sold_to) if sold_to else None,
+            ' '.join(ship_to) if ship_to else None,
+        )
 
     def _parse_compressed_line_item(self, row: List[str]) -> Optional[Dict[str, Any]]:
         """
@@ -394,19 +506,19 @@ class InvoiceProcessor(BaseProcessor):
         lines = [line.strip() for line in cell_text.split('\n') if line.strip()]
         
         # Extract quantity (first number at the beginning)
-        qty_match = re.search(r'^\s*(\d+)', cell_text)
+        qty_match = _ITEM_QTY_RE.search(cell_text)
         if qty_match:
             item['qty'] = int(qty_match.group(1))
         
         # Extract style code (pattern: 6 digits - 3 digits)
-        style_match = re.search(r'(\d{6}-\d{3})', cell_text)
+        style_match = _ITEM_STYLE_RE.search(cell_text)
         if style_match:
             item['style_color'] = style_match.group(1)
         
         # Extract size - look for "Size" followed by letters/numbers
-        size_match = re.search(r'Size\s+([A-Z0-9]+)', cell_text, re.IGNORECASE)
+        size_match = _ITEM_SIZE_RE.search(cell_text)
         if size_match:
-            item['size'] = size_match.group(1)
+            item['size'] = sys.intern(size_match.group(1))
         
         # Extract description - this is the text between style code and material specifications
         # Look for the main product description that appears after the style code
@@ -422,13 +534,12 @@ class InvoiceProcessor(BaseProcessor):
             
             # Extract description text
             if desc_end > style_pos:
-                desc_text = cell_text[style_pos:desc_end].strip()
+                desc_text = cell_text[style_pos:desc_end]
                 # Remove the style code from the beginning
                 if item.get('style_color'):
-                    desc_text = desc_text.replace(item['style_color'], '').strip()
+                    desc_text = desc_text.replace(item['style_color'], '')
                 # Clean up common prefixes/suffixes
-                desc_text = re.sub(r'^[-:\s]+', '', desc_text)  # Remove leading dashes, colons, spaces
-                desc_text = re.sub(r'[-:\s]+$', '', desc_text)  # Remove trailing dashes, colons, spaces
+                desc_text = _clean_desc(desc_text)
                 if desc_text:
                     item['style_color_descr'] = desc_text
         
@@ -436,17 +547,17 @@ class InvoiceProcessor(BaseProcessor):
         material_specs = []
         
         # Look for Main Body specification
-        main_body_match = re.search(r'Main Body\s*:\s*([^;\n]+)', cell_text, re.IGNORECASE)
+        main_body_match = _MAIN_BODY_RE.search(cell_text)
         if main_body_match:
             material_specs.append(f"Main Body: {main_body_match.group(1).strip()}")
         
         # Look for Trim specifications (can be multiple)
-        trim_matches = re.findall(r'Trim\s*\d*\s*:\s*([^;\n]+)', cell_text, re.IGNORECASE)
+        trim_matches = _TRIM_RE.findall(cell_text)
         for i, trim_match in enumerate(trim_matches, 1):
             material_specs.append(f"Trim{i}: {trim_match.strip()}")
         
         # Look for Lining specification
-        lining_match = re.search(r'Lining\s*:\s*([^;\n]+)', cell_text, re.IGNORECASE)
+        lining_match = _LINING_RE.search(cell_text)
         if lining_match:
             material_specs.append(f"Lining: {lining_match.group(1).strip()}")
         
@@ -455,17 +566,18 @@ class InvoiceProcessor(BaseProcessor):
             item['other_descr'] = '; '.join(material_specs)
         
         # Extract country of origin
-        country_match = re.search(r'Country of Origin:\s*([A-Z]{2,})', cell_text, re.IGNORECASE)
+        country_match = _COUNTRY_RE.search(cell_text)
         if country_match:
-            item['country_of_origin'] = country_match.group(1)
+            # Low-cardinality codes share one string object across all rows
+            item['country_of_origin'] = sys.intern(country_match.group(1))
         
         # Extract tariff code
-        tariff_match = re.search(r'Tariff code:\s*(\d+\.\d+\.\d+)', cell_text, re.IGNORECASE)
+        tariff_match = _TARIFF_RE.search(cell_text)
         if tariff_match:
             item['tariff_code'] = tariff_match.group(1)
         
         # Extract delivery ID if present in the line item
-        delivery_match = re.search(r'Delivery\s*#\s*(\d+)', cell_text, re.IGNORECASE)
+        delivery_match = _DELIVERY_RE.search(cell_text)
         if delivery_match:
             item['delivery_id'] = delivery_match.group(1)
         
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import re
 
+try:
+    import pymupdf as fitz
+except ImportError:
+    fitz = None
+
 try:
     import pdfplumber
 except ImportError:
@@ -23,10 +32,151 @@ try:
 except ImportError:
     pd = None
 
-from ..models import ProcessingJob, ProcessingResult, ProcessingStatus
-from ..utils import parse_page_range
+from ..models import ProcessingJob, ProcessingResult, ProcessingStatus, TextBlock
+from ..utils import calculate_file_fingerprint, parse_page_range
 from .base import BaseProcessor
 
+# Documents shorter than this are extracted serially; below it the cost of
+# starting worker processes outweighs the per-page parallelism.
+_PARALLEL_MIN_PAGES = 8
+
+# Upper bound on documents processed at once by process_batch; each worker
+# holds a whole parsed PDF in memory.
+_BATCH_MAX_WORKERS = 4
+
+# Page text backend used unless config["text_backend"] says otherwise. The
+# invoice parsing downstream is line-based and tuned to pdfplumber's layout;
+# PyMuPDF puts each text run on its own line, so it is opt-in ("pymupdf").
+_DEFAULT_TEXT_BACKEND = "pdfplumber"
+
+# Ruling-line table detection (pdfplumber's defaults), stated explicitly so
+# table finding does not depend on the installed version's defaults
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+}
+
+# Table content analysis patterns
+_DIGIT_RE = re.compile(r'\d')
+_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+_CURRENCY_RE = re.compile(r'[\$€£¥]\s*\d+\.?\d*')
+
+# Checked with substring searches, which stop at the first digit found
+_DIGITS = "0123456789"
+
+# Case-insensitive URL hint, matched without building a lowercased copy
+_URL_HINT_RE = re.compile(r'http', re.IGNORECASE)
+
+# Joins cells into one buffer for analysis; not whitespace or a digit, so no
+# pattern above can match across a cell boundary
+_CELL_SEPARATOR = "\x00"
+
+
+@contextmanager
+def _open_pdf(path: Any) -> Iterator[Any]:
+    """Open a PDF with the preferred backend.
+    
+    Yields:
+        A pdfplumber PDF, or a PyPDF2 reader when pdfplumber is unavailable
+    """
+    if pdfplumber is not None:
+        with pdfplumber.open(path) as pdf:
+            yield pdf
+    elif PyPDF2 is not None:
+        # PdfReader accepts any seekable stream; reading from a read-only
+        # mapping serves pages from the OS page cache instead of copying the
+        # file through a user-space buffer
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield PyPDF2.PdfReader(mm)
+    else:
+        raise RuntimeError("No PDF extraction backend available")
+
+
+@contextmanager
+def _open_text_pdf(path: Any, want_text: bool) -> Iterator[Optional[Any]]:
+    """Open a PyMuPDF document for fast text extraction.
+    
+    pdfplumber stays responsible for tables; PyMuPDF only supplies page text.
+    
+    Args:
+        path: PDF file path
+        want_text: Whether PyMuPDF text is wanted (requested and opted in)
+    
+    Yields:
+        A fitz Document, or None when PyMuPDF is unavailable, text is not
+        wanted or the file cannot be opened by PyMuPDF
+    """
+    if fitz is None or not want_text:
+        yield None
+        return
+    
+    try:
+        doc = fitz.open(str(path))
+    except Exception:
+        yield None
+        return
+    
+    with doc:
+        yield doc
+
+
+def _text_page(text_doc: Optional[Any], page_num: int) -> Optional[Any]:
+    """Get a 1-indexed page from a PyMuPDF document, if it has one."""
+    if text_doc is not None and 0 <= page_num - 1 < text_doc.page_count:
+        return text_doc[page_num - 1]
+    return None
+
+
+def _text_method_name(page: Any) -> str:
+    """Name the backend _extract_text_from_page uses for page."""
+    if fitz is not None and isinstance(page, fitz.Page):
+        return "pymupdf"
+    if pdfplumber is not None:
+        return "pdfplumber"
+    return "pypdf2"
+
+
+def _stringify_table(table: List[List[Any]]) -> List[List[str]]:
+    """Convert table cells to strings, with empty cells as ""."""
+    return [[str(cell) if cell is not None else "" for cell in row] for row in table]
+
+
+def _worker_extract(
+    path: str,
+    page_nums: List[int],
+    want_text: bool,
+    want_tables: bool,
+    min_table_size: int,
+    use_pymupdf: bool = False
+) -> List[Tuple[int, str, Optional[str], List[List[List[str]]]]]:
+    """Extract a contiguous range of pages in a worker process.
+    
+    Each worker opens its own document (parsed PDF objects are not picklable)
+    and reuses it for the whole range.
+    """
+    processor = PDFProcessor()
+    results = []
+    with _open_pdf(path) as pdf, _open_text_pdf(path, want_text and use_pymupdf) as text_doc:
+        total_pages = len(pdf.pages)
+        for page_num in page_nums:
+            if 0 <= page_num - 1 < total_pages:
+                page_text, text_method, page_tables = processor._read_page(
+                    pdf.pages[page_num - 1], page_num, want_text, want_tables, min_table_size,
+                    text_page=_text_page(text_doc, page_num)
+                )
+                results.append((page_num, page_text, text_method, page_tables))
+    return results
+
+
+def _worker_process(config: Dict[str, Any], job: ProcessingJob) -> ProcessingResult:
+    """Process one job in a batch worker process.
+    
+    Page-level parallelism is turned off so that batch workers do not each
+    start a pool of their own.
+    """
+    processor = PDFProcessor({**config, "max_workers": 1})
+    return processor.process(job)
+
 
 class PDFProcessor(BaseProcessor):
     """PDF processor using multiple extraction methods for robustness."""
@@ -39,11 +189,16 @@ class PDFProcessor(BaseProcessor):
         """
         super().__init__(config)
         self.extraction_methods = self._get_available_methods()
+        self.use_pymupdf = self.config.get("text_backend", _DEFAULT_TEXT_BACKEND) == "pymupdf"
+        self._page_count_cache: Dict[Tuple[str, float], int] = {}
     
     def _get_available_methods(self) -> List[str]:
         """Get list of available extraction methods."""
         methods = []
         
+        if fitz is not None:
+            methods.append("pymupdf")
+        
         if pdfplumber is not None:
             methods.append("pdfplumber")
         
@@ -55,7 +210,8 @@ class PDFProcessor(BaseProcessor):
     def can_process(self, file_path: str) -> bool:
         """Check if this processor can handle the given file."""
         path = Path(file_path)
-        return path.suffix.lower() == ".pdf" and len(self.extraction_methods) > 0
+        # PyMuPDF only supplies text; pages are opened with pdfplumber or PyPDF2
+        return path.suffix.lower() == ".pdf" and (pdfplumber is not None or PyPDF2 is not None)
     
     def process(self, job: ProcessingJob) -> ProcessingResult:
         """Process the PDF file according to the job specifications."""
@@ -81,79 +237,49 @@ class PDFProcessor(BaseProcessor):
             extracted_data = {}
             metadata = {}
             
-            # Get page range
-            pages_to_process = self._get_pages_to_process(job)
-            total_pages = len(pages_to_process)
-            
-            if total_pages == 0:
-                job.status = ProcessingStatus.FAILED
-                job.error_message = "No pages to process"
-                job.completed_at = datetime.now()
-                return ProcessingResult(
-                    job=job,
-                    processing_time=time.time() - start_time
-                )
-            
-            # Extract text if requested
-            if job.pdf_options.extract_text:
-                text_data = self._extract_text_enhanced(job, pages_to_process)
-                extracted_data["text"] = text_data
-                job.text_blocks_extracted = len(text_data.get("text_blocks", []))
-            
-            # Extract tables if requested
-            if job.pdf_options.extract_tables:
-                table_data = self._extract_tables_enhanced(job, pages_to_process)
-                extracted_data["tables"] = table_data
-                job.tables_extracted = len(table_data.get("tables", []))
-            
-            # Extract enhanced metadata
-            metadata = self._extract_metadata_enhanced(job)
-            
-            # Update job with results
-            job.pages_processed = total_pages
-            job.status = ProcessingStatus.COMPLETED
-            job.completed_at = datetime.now()
-            
-            processing_time = time.time() - start_time
-            
-            return ProcessingResult(
-                job=job,
-                extracted_data=extracted_data,
-                metadata=metadata,
-                processing_time=processing_time
-            )
-            
-            # Extract data based on processing options
-            extracted_data = {}
-            metadata = {}
-            
-            # Get page range
-            pages_to_process = self._get_pages_to_process(job)
-            total_pages = len(pages_to_process)
-            
-            if total_pages == 0:
-                job.status = ProcessingStatus.FAILED
-                job.error_message = "No pages to process"
-                job.completed_at = datetime.now()
-                return ProcessingResult(
-                    job=job,
-                    processing_time=time.time() - start_time
+            # Open the document once and share it between page counting,
+            # extraction and metadata. If it cannot be opened here, each step
+            # falls back to opening it itself and reports its own error.
+            with ExitStack() as stack:
+                try:
+                    pdf = stack.enter_context(self._open(job))
+                except Exception:
+                    pdf = None
+                
+                # Get page range
+                pages_to_process = self._get_pages_to_process(job, pdf)
+                total_pages = len(pages_to_process)
+                
+                if total_pages == 0:
+                    job.status = ProcessingStatus.FAILED
+                    job.error_message = "No pages to process"
+                    job.completed_at = datetime.now()
+                    return ProcessingResult(
+                        job=job,
+                        processing_time=time.time() - start_time
+                    )
+                
+                # Extract text and tables in a single pass over the document
+                text_data, table_data = self._extract_content(
+                    job,
+                    pages_to_process,
+                    extract_text=job.pdf_options.extract_text,
+                    extract_tables=job.pdf_options.extract_tables,
+                    pdf=pdf
                 )
-            
-            # Extract text if requested
-            if job.pdf_options.extract_text:
-                text_data = self._extract_text(job, pages_to_process)
-                extracted_data["text"] = text_data
-                job.text_blocks_extracted = len(text_data.get("text_blocks", []))
-            
-            # Extract tables if requested
-            if job.pdf_options.extract_tables:
-                table_data = self._extract_tables(job, pages_to_process)
-                extracted_data["tables"] = table_data
-                job.tables_extracted = len(table_data.get("tables", []))
-            
-            # Extract metadata
-            metadata = self._extract_metadata(job)
+                
+                if text_data is not None:
+                    text_data = self._extract_text_enhanced(text_data)
+                    extracted_data["text"] = text_data
+                    job.text_blocks_extracted = len(text_data.get("text_blocks", []))
+                
+                if table_data is not None:
+                    table_data = self._extract_tables_enhanced(table_data)
+                    extracted_data["tables"] = table_data
+                    job.tables_extracted = len(table_data.get("tables", []))
+                
+                # Extract enhanced metadata
+                metadata = self._extract_metadata_enhanced(job, pdf)
             
             # Update job with results
             job.pages_processed = total_pages
@@ -179,100 +305,177 @@ class PDFProcessor(BaseProcessor):
                 processing_time=time.time() - start_time
             )
     
-    def _get_pages_to_process(self, job: ProcessingJob) -> List[int]:
+    def _get_pages_to_process(self, job: ProcessingJob, pdf: Optional[Any] = None) -> List[int]:
         """Get list of pages to process based on job options."""
         if job.pdf_options.page_range:
             return parse_page_range(job.pdf_options.page_range)
         
         # Process all pages
+        return list(range(1, self._get_page_count(job, pdf) + 1))
+    
+    def _get_page_count(self, job: ProcessingJob, pdf: Optional[Any] = None) -> int:
+        """Get the total page count of the job's PDF.
+        
+        Counts are cached per (path, modification time), so re-processing an
+        unchanged file does not reparse the document just to count pages.
+        
+        Args:
+            job: Processing job
+            pdf: Already open document to count from, if any
+            
+        Returns:
+            Number of pages, or 0 if the PDF cannot be read
+        """
         try:
-            if pdfplumber is not None:
-                with pdfplumber.open(job.input_file) as pdf:
-                    return list(range(1, len(pdf.pages) + 1))
-            elif PyPDF2 is not None:
-                with open(job.input_file, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    return list(range(1, len(reader.pages) + 1))
+            key = (str(job.input_file), job.input_file.stat().st_mtime)
+            if key not in self._page_count_cache:
+                with self._open(job, pdf) as doc:
+                    self._page_count_cache[key] = len(doc.pages)
+            return self._page_count_cache[key]
         except Exception:
-            pass
-        
-        return []
+            return 0
     
-    def _extract_text(self, job: ProcessingJob, pages: List[int]) -> Dict[str, Any]:
-        """Extract text from PDF pages."""
-        text_data = {
-            "text_blocks": [],
-            "full_text": "",
-            "page_texts": {}
-        }
+    def process_batch(
+        self,
+        jobs: List[ProcessingJob],
+        max_workers: Optional[int] = None
+    ) -> List[ProcessingResult]:
+        """Process several PDF jobs across worker processes.
         
-        for i, page_num in enumerate(pages):
-            try:
-                page_text = self._extract_text_from_page(job, page_num)
-                if page_text:
-                    text_data["page_texts"][page_num] = page_text
-                    text_data["text_blocks"].append({
-                        "page": page_num,
-                        "text": page_text,
-                        "length": len(page_text)
-                    })
-                    text_data["full_text"] += f"\n\n--- Page {page_num} ---\n{page_text}"
+        Each worker runs a processor with this processor's config. Workers
+        process copies of the jobs, so take the updated job from each result.
+        
+        Args:
+            jobs: Jobs to process
+            max_workers: Number of worker processes (defaults to the CPU count,
+                capped at 4 to bound memory use)
+            
+        Returns:
+            Processing results in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, _BATCH_MAX_WORKERS)
+        max_workers = max(1, min(max_workers, len(jobs)))
+        
+        if max_workers == 1:
+            return [self.process(job) for job in jobs]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for i, result in enumerate(executor.map(_worker_process, [self.config] * len(jobs), jobs)):
+                results.append(result)
                 
                 # Update progress
-                self.update_progress(i + 1, f"Extracting text from page {page_num}")
-                
-            except Exception as e:
-                # Log error but continue with other pages
-                print(f"Error extracting text from page {page_num}: {e}")
+                self.update_progress(i + 1, f"Processed {result.job.input_file.name}")
         
-        return text_data
+        return results
     
-    def _extract_text_from_page(self, job: ProcessingJob, page_num: int) -> str:
-        """Extract text from a specific page."""
-        if pdfplumber is not None:
-            return self._extract_text_with_pdfplumber(job, page_num)
-        elif PyPDF2 is not None:
-            return self._extract_text_with_pypdf2(job, page_num)
-        else:
-            return ""
-    
-    def _extract_text_with_pdfplumber(self, job: ProcessingJob, page_num: int) -> str:
-        """Extract text using pdfplumber."""
-        try:
-            with pdfplumber.open(job.input_file) as pdf:
-                if 0 <= page_num - 1 < len(pdf.pages):
-                    page = pdf.pages[page_num - 1]
-                    text = page.extract_text()
-                    return text or ""
-        except Exception as e:
-            print(f"Error with pdfplumber on page {page_num}: {e}")
+    @contextmanager
+    def _open(self, job: ProcessingJob, pdf: Optional[Any] = None) -> Iterator[Any]:
+        """Open the PDF once with the preferred backend.
         
-        return ""
-    
-    def _extract_text_with_pypdf2(self, job: ProcessingJob, page_num: int) -> str:
-        """Extract text using PyPDF2."""
-        try:
-            with open(job.input_file, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                if 0 <= page_num - 1 < len(reader.pages):
-                    page = reader.pages[page_num - 1]
-                    text = page.extract_text()
-                    return text or ""
-        except Exception as e:
-            print(f"Error with PyPDF2 on page {page_num}: {e}")
+        Args:
+            job: Processing job
+            pdf: Already open document to reuse instead of opening a new one
+            
+        Yields:
+            A pdfplumber PDF, or a PyPDF2 reader when pdfplumber is unavailable
+        """
+        if pdf is not None:
+            yield pdf
+            return
         
-        return ""
+        with _open_pdf(job.input_file) as opened:
+            yield opened
     
-    def _extract_tables(self, job: ProcessingJob, pages: List[int]) -> Dict[str, Any]:
-        """Extract tables from PDF pages."""
-        table_data = {
-            "tables": [],
-            "total_tables": 0
-        }
+    def _extract_content(
+        self,
+        job: ProcessingJob,
+        pages: List[int],
+        extract_text: bool = True,
+        extract_tables: bool = True,
+        pdf: Optional[Any] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Extract text and/or tables from PDF pages in a single pass.
         
-        for i, page_num in enumerate(pages):
-            try:
-                page_tables = self._extract_tables_from_page(job, page_num)
+        The document is opened once and each requested page is visited once,
+        so text and tables come from the same parsed page object.
+        
+        Args:
+            job: Processing job
+            pages: 1-indexed page numbers to extract
+            extract_text: Whether to extract text
+            extract_tables: Whether to extract tables
+            pdf: Already open document to read serially from, if any
+            
+        Returns:
+            Tuple of (text_data, table_data); an entry is None when not requested
+        """
+        text_data: Optional[Dict[str, Any]] = None
+        table_data: Optional[Dict[str, Any]] = None
+        
+        if extract_text:
+            text_data = {
+                "text_blocks": [],
+                "full_text": "",
+                "page_texts": {}
+            }
+        
+        if extract_tables:
+            table_data = {
+                "tables": [],
+                "total_tables": 0
+            }
+        
+        # Table extraction needs pdfplumber page geometry
+        want_text = extract_text
+        want_tables = extract_tables and pdfplumber is not None
+        if not want_text and not want_tables:
+            return text_data, table_data
+        
+        max_workers = self._get_max_workers(len(pages))
+        if max_workers > 1:
+            page_results = self._read_pages_parallel(job, pages, want_text, want_tables, max_workers)
+        else:
+            page_results = self._read_pages_serial(job, pages, want_text, want_tables, pdf)
+        
+        # Page sections are joined once at the end; growing a str stored in a
+        # dict with += copies the accumulated text on every page
+        full_text_chunks: List[str] = []
+        
+        # Text statistics are accumulated per page section, so the joined
+        # full text is never traversed again for analysis
+        total_words = 0
+        total_characters = 0
+        total_newlines = 0
+        has_numbers = False
+        has_emails = False
+        has_urls = False
+        
+        # Backends that actually produced page text, in first-use order
+        text_methods: Dict[str, None] = {}
+        
+        for page_num, page_text, text_method, page_tables in page_results:
+            if text_data is not None and page_text:
+                if text_method:
+                    text_methods[text_method] = None
+                text_data["page_texts"][page_num] = page_text
+                text_data["text_blocks"].append(TextBlock(page_num, page_text, len(page_text)))
+                section = f"\n\n--- Page {page_num} ---\n{page_text}"
+                full_text_chunks.append(section)
+                
+                # Sections start with whitespace, so per-section word counts add up
+                total_words += len(section.split())
+                total_characters += len(section)
+                total_newlines += section.count('\n')
+                has_numbers = has_numbers or any(d in section for d in _DIGITS)
+                has_emails = has_emails or "@" in section
+                has_urls = has_urls or _URL_HINT_RE.search(section) is not None
+            
+            if table_data is not None:
                 for table in page_tables:
                     table_data["tables"].append({
                         "page": page_num,
@@ -281,50 +484,197 @@ class PDFProcessor(BaseProcessor):
                         "rows": len(table) if table else 0,
                         "columns": len(table[0]) if table and table[0] else 0
                     })
+        
+        if text_data is not None:
+            text_data["full_text"] = "".join(full_text_chunks)
+            text_data["total_words"] = total_words
+            text_data["total_characters"] = total_characters
+            text_data["total_lines"] = total_newlines + 1
+            text_data["has_numbers"] = has_numbers
+            text_data["has_emails"] = has_emails
+            text_data["has_urls"] = has_urls
+            if text_methods:
+                text_data["extraction_method"] = "+".join(text_methods)
+        
+        if table_data is not None:
+            table_data["total_tables"] = len(table_data["tables"])
+        
+        return text_data, table_data
+    
+    def _get_max_workers(self, page_count: int) -> int:
+        """Get the number of worker processes to use for a document.
+        
+        Extraction is serial unless config["max_workers"] asks for more
+        workers; forking a pool by default is unsafe for threaded callers
+        such as the GUI and for scripts without a __main__ guard.
+        """
+        if page_count < _PARALLEL_MIN_PAGES:
+            return 1
+        max_workers = self.config.get("max_workers") or 1
+        return max(1, min(max_workers, page_count))
+    
+    def _read_pages_serial(
+        self,
+        job: ProcessingJob,
+        pages: List[int],
+        want_text: bool,
+        want_tables: bool,
+        pdf: Optional[Any] = None
+    ) -> List[Tuple[int, str, Optional[str], List[List[List[str]]]]]:
+        """Read pages in this process, reusing one open document."""
+        results = []
+        
+        try:
+            with self._open(job, pdf) as pdf, _open_text_pdf(
+                job.input_file, want_text and self.use_pymupdf
+            ) as text_doc:
+                total_pages = len(pdf.pages)
                 
-                table_data["total_tables"] = len(table_data["tables"])
+                for i, page_num in enumerate(pages):
+                    if 0 <= page_num - 1 < total_pages:
+                        page_text, text_method, page_tables = self._read_page(
+                            pdf.pages[page_num - 1],
+                            page_num,
+                            want_text,
+                            want_tables,
+                            job.pdf_options.min_table_size,
+                            text_page=_text_page(text_doc, page_num)
+                        )
+                        results.append((page_num, page_text, text_method, page_tables))
+                    
+                    # Update progress
+                    self.update_progress(i + 1, f"Extracting content from page {page_num}")
+        except Exception as e:
+            print(f"Error opening PDF {job.input_file}: {e}")
+        
+        return results
+    
+    def _read_pages_parallel(
+        self,
+        job: ProcessingJob,
+        pages: List[int],
+        want_text: bool,
+        want_tables: bool,
+        max_workers: int
+    ) -> List[Tuple[int, str, Optional[str], List[List[List[str]]]]]:
+        """Read pages across worker processes.
+        
+        Pages are split into one contiguous range per worker so each worker
+        parses the document once; results are returned in page order.
+        """
+        chunk_size = -(-len(pages) // max_workers)
+        chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+        chunk_results: List[List[Tuple[int, str, Optional[str], List[List[List[str]]]]]] = [[] for _ in chunks]
+        pages_done = 0
+        
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = {
+                executor.submit(
+                    _worker_extract,
+                    str(job.input_file),
+                    chunk,
+                    want_text,
+                    want_tables,
+                    job.pdf_options.min_table_size,
+                    self.use_pymupdf
+                ): idx
+                for idx, chunk in enumerate(chunks)
+            }
+            
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    chunk_results[idx] = future.result()
+                except Exception as e:
+                    print(f"Error extracting pages {chunks[idx][0]}-{chunks[idx][-1]}: {e}")
                 
                 # Update progress
-                self.update_progress(i + 1, f"Extracting tables from page {page_num}")
-                
+                pages_done += len(chunks[idx])
+                self.update_progress(pages_done, f"Extracted pages {chunks[idx][0]}-{chunks[idx][-1]}")
+        
+        return [result for chunk in chunk_results for result in chunk]
+    
+    def _read_page(
+        self,
+        page: Any,
+        page_num: int,
+        want_text: bool,
+        want_tables: bool,
+        min_table_size: int,
+        text_page: Optional[Any] = None
+    ) -> Tuple[str, Optional[str], List[List[List[str]]]]:
+        """Read text and tables from one opened page.
+        
+        Text is taken from text_page (a PyMuPDF page) when given, otherwise
+        from page. Errors are reported and the page contributes no content of
+        that kind.
+        
+        Returns:
+            Tuple of (page_text, text_method, page_tables); text_method names
+            the backend that produced the text, or is None if none did
+        """
+        page_text = ""
+        text_method: Optional[str] = None
+        page_tables: List[List[List[str]]] = []
+        
+        if want_text:
+            text_source = text_page if text_page is not None else page
+            try:
+                page_text = self._extract_text_from_page(text_source)
+                text_method = _text_method_name(text_source)
+            except Exception as e:
+                # Log error but continue with other pages
+                print(f"Error extracting text from page {page_num}: {e}")
+        
+        if want_tables:
+            try:
+                page_tables = self._extract_tables_with_pdfplumber(page, min_table_size)
             except Exception as e:
                 print(f"Error extracting tables from page {page_num}: {e}")
         
-        return table_data
+        return page_text, text_method, page_tables
     
-    def _extract_tables_from_page(self, job: ProcessingJob, page_num: int) -> List[List[List[str]]]:
-        """Extract tables from a specific page."""
-        if pdfplumber is not None:
-            return self._extract_tables_with_pdfplumber(job, page_num)
+    def _extract_text_from_page(self, page: Any) -> str:
+        """Extract text from an opened page."""
+        if fitz is not None and isinstance(page, fitz.Page):
+            return self._extract_text_with_pymupdf(page)
+        elif pdfplumber is not None:
+            return self._extract_text_with_pdfplumber(page)
+        elif PyPDF2 is not None:
+            return self._extract_text_with_pypdf2(page)
         else:
-            return []
+            return ""
     
-    def _extract_tables_with_pdfplumber(self, job: ProcessingJob, page_num: int) -> List[List[List[str]]]:
-        """Extract tables using pdfplumber."""
-        try:
-            with pdfplumber.open(job.input_file) as pdf:
-                if 0 <= page_num - 1 < len(pdf.pages):
-                    page = pdf.pages[page_num - 1]
-                    tables = page.extract_tables()
-                    
-                    # Filter tables based on minimum size
-                    filtered_tables = []
-                    for table in tables:
-                        if table and len(table) >= job.pdf_options.min_table_size:
-                            # Convert all cells to strings
-                            processed_table = []
-                            for row in table:
-                                processed_row = [str(cell) if cell is not None else "" for cell in row]
-                                processed_table.append(processed_row)
-                            filtered_tables.append(processed_table)
-                    
-                    return filtered_tables
-        except Exception as e:
-            print(f"Error extracting tables with pdfplumber on page {page_num}: {e}")
+    def _extract_text_with_pymupdf(self, page: Any) -> str:
+        """Extract text from a PyMuPDF page."""
+        return page.get_text("text") or ""
+    
+    def _extract_text_with_pdfplumber(self, page: Any) -> str:
+        """Extract text from a pdfplumber page."""
+        return page.extract_text() or ""
+    
+    def _extract_text_with_pypdf2(self, page: Any) -> str:
+        """Extract text from a PyPDF2 page."""
+        return page.extract_text() or ""
+    
+    def _extract_tables_with_pdfplumber(self, page: Any, min_table_size: int) -> List[List[List[str]]]:
+        """Extract tables from a pdfplumber page."""
+        # Pages without detected tables return before any cell extraction
+        found = page.find_tables(table_settings=_TABLE_SETTINGS)
+        if not found:
+            return []
+        tables = [table.extract() for table in found]
+        
+        # Filter tables based on minimum size
+        filtered_tables = []
+        for table in tables:
+            if table and len(table) >= min_table_size:
+                # Convert all cells to strings
+                filtered_tables.append(_stringify_table(table))
         
-        return []
+        return filtered_tables
     
-    def _extract_metadata(self, job: ProcessingJob) -> Dict[str, Any]:
+    def _extract_metadata(self, job: ProcessingJob, pdf: Optional[Any] = None) -> Dict[str, Any]:
         """Extract PDF metadata."""
         metadata = {
             "filename": job.input_file.name,
@@ -334,47 +684,32 @@ class PDFProcessor(BaseProcessor):
         }
         
         try:
-            if pdfplumber is not None:
-                with pdfplumber.open(job.input_file) as pdf:
-                    metadata["total_pages"] = len(pdf.pages)
-                    if pdf.metadata:
-                        metadata["pdf_metadata"] = pdf.metadata
-            elif PyPDF2 is not None:
-                with open(job.input_file, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    metadata["total_pages"] = len(reader.pages)
-                    if reader.metadata:
-                        metadata["pdf_metadata"] = reader.metadata
+            # pdfplumber documents and PyPDF2 readers both expose pages/metadata
+            with self._open(job, pdf) as doc:
+                metadata["total_pages"] = len(doc.pages)
+                if doc.metadata:
+                    metadata["pdf_metadata"] = doc.metadata
         except Exception as e:
             metadata["metadata_error"] = str(e)
         
         return metadata
     
-    def _extract_text_enhanced(self, job: ProcessingJob, pages: List[int]) -> Dict[str, Any]:
-        """Enhanced text extraction with detailed analysis."""
-        text_data = self._extract_text(job, pages)
+    def _extract_text_enhanced(self, text_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add extraction details to text data.
         
-        # Add enhanced analysis
-        text_data["extraction_method"] = "pdfplumber" if pdfplumber else "pypdf2"
+        Word, character and line counts and the content flags are already
+        computed page by page during extraction.
+        """
+        # The backend is recorded during extraction; without any page text,
+        # report the one that would have been used
+        if "extraction_method" not in text_data:
+            text_data["extraction_method"] = "pdfplumber" if pdfplumber else "pypdf2"
         text_data["extraction_time"] = time.time()  # Placeholder for actual timing
         
-        # Analyze text content
-        full_text = text_data.get("full_text", "")
-        text_data["total_words"] = len(full_text.split())
-        text_data["total_characters"] = len(full_text)
-        text_data["total_lines"] = len(full_text.split('\n'))
-        
-        # Content analysis
-        text_data["has_numbers"] = any(c.isdigit() for c in full_text)
-        text_data["has_emails"] = "@" in full_text
-        text_data["has_urls"] = "http" in full_text.lower()
-        
         return text_data
     
-    def _extract_tables_enhanced(self, job: ProcessingJob, pages: List[int]) -> Dict[str, Any]:
-        """Enhanced table extraction with detailed analysis."""
-        table_data = self._extract_tables(job, pages)
-        
+    def _extract_tables_enhanced(self, table_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add detailed analysis to extracted table data."""
         # Add enhanced analysis
         table_data["extraction_method"] = "pdfplumber"
         table_data["extraction_time"] = time.time()  # Placeholder for actual timing
@@ -384,39 +719,27 @@ class PDFProcessor(BaseProcessor):
             table_content = table_info.get("data", [])
             
             # Calculate empty cells
-            empty_cells = sum(1 for row in table_content for cell in row if not cell or cell.strip() == "")
+            empty_cells = sum(1 for row in table_content for cell in row if not (cell and cell.strip()))
             table_info["empty_cells"] = empty_cells
             table_info["total_cells"] = len(table_content) * len(table_content[0]) if table_content else 0
             
-            # Analyze data types
-            has_numeric = False
-            has_dates = False
-            has_currency = False
-            
-            for row in table_content:
-                for cell in row:
-                    if cell:
-                        if any(c.isdigit() for c in cell):
-                            has_numeric = True
-                        if re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', cell):
-                            has_dates = True
-                        if re.search(r'[\$€£¥]\s*\d+\.?\d*', cell):
-                            has_currency = True
-            
-            table_info["has_numeric_data"] = has_numeric
-            table_info["has_date_data"] = has_dates
-            table_info["has_currency_data"] = has_currency
+            # Analyze data types with one scan per pattern over all cells
+            joined = _CELL_SEPARATOR.join(cell for row in table_content for cell in row if cell)
+            table_info["has_numeric_data"] = _DIGIT_RE.search(joined) is not None
+            table_info["has_date_data"] = _DATE_RE.search(joined) is not None
+            table_info["has_currency_data"] = _CURRENCY_RE.search(joined) is not None
         
         return table_data
     
-    def _extract_metadata_enhanced(self, job: ProcessingJob) -> Dict[str, Any]:
+    def _extract_metadata_enhanced(self, job: ProcessingJob, pdf: Optional[Any] = None) -> Dict[str, Any]:
         """Enhanced metadata extraction with additional information."""
-        metadata = self._extract_metadata(job)
+        metadata = self._extract_metadata(job, pdf)
         
         # Add file hash
-        # Assuming calculate_file_hash is defined elsewhere or will be added
-        # For now, we'll just add a placeholder
-        metadata["file_hash"] = "placeholder_hash" 
+        try:
+            metadata["file_hash"] = calculate_file_fingerprint(job.input_file)
+        except (OSError, ValueError) as e:
+            metadata["file_hash_error"] = str(e)
         
         # Add processing timestamp
         metadata["processing_timestamp"] = datetime.now().isoformat()
@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import time
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import pandas as pd
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils.dataframe import dataframe_to_rows
+    from openpyxl.utils import get_column_letter
 except ImportError:
     Workbook = None
+    WriteOnlyCell = None
+    get_column_letter = None
     Font = None
     Alignment = None
     PatternFill = None
     Border = None
     Side = None
-    dataframe_to_rows = None
 
 from ..models import ProcessingResult
 from ..utils import generate_output_filename
@@ -34,6 +37,14 @@ class StructuredExcelWriter(BaseProcessor):
         super().__init__(config)
         self._check_dependencies()
         self.invoice_processor = InvoiceProcessor()
+        
+        # Style objects are shared by every cell they apply to rather than
+        # rebuilt per cell
+        self._header_font = Font(bold=True, color="FFFFFF")
+        self._header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        self._zebra_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+        self._title_font = Font(bold=True, size=14)
+        self._label_font = Font(bold=True)
     
     def _check_dependencies(self) -> None:
         """Check if required dependencies are available."""
@@ -70,11 +81,9 @@ class StructuredExcelWriter(BaseProcessor):
             result.metadata
         )
         
-        # Create workbook
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Create a write-only workbook: rows are streamed to the file instead
+        # of being held as an in-memory cell grid. It has no default sheet.
+        wb = Workbook(write_only=True)
         
         # Create main data sheet
         ws = wb.create_sheet(title="Invoice_Data")
@@ -103,67 +112,72 @@ class StructuredExcelWriter(BaseProcessor):
         )
     
     def _write_structured_data(self, ws: Any, df: pd.DataFrame) -> None:
-        """Write structured data to worksheet."""
-        if Font is None or PatternFill is None or dataframe_to_rows is None:
+        """Write structured data to a write-only worksheet."""
+        if WriteOnlyCell is None or get_column_letter is None:
             raise ImportError("openpyxl is required for structured Excel writing")
             
         if df.empty:
             # Write empty structure with headers
-            headers = self.invoice_processor.required_columns
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
+            headers = list(self.invoice_processor.required_columns)
+            rows = iter([headers])
         else:
-            # Write data with headers
-            for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                    
-                    # Style headers
-                    if r_idx == 1:
-                        cell.font = Font(bold=True)
-                        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                        cell.font = Font(bold=True, color="FFFFFF")
-                    else:
-                        # Style data rows
-                        if r_idx % 2 == 0:
-                            cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+            # Write data with headers; plain tuples skip the namedtuple and
+            # list copies dataframe_to_rows makes for every row
+            headers = list(df.columns)
+            rows = chain([headers], df.itertuples(index=False, name=None))
+        
+        # A write-only sheet emits its column settings with the first row, so
+        # widths come from a values-only pass before anything is appended
+        col_widths = [len(str(value)) if value else 0 for value in headers]
+        if not df.empty:
+            for c_idx in range(len(headers)):
+                for value in df.iloc[:, c_idx]:
+                    if value and len(str(value)) > col_widths[c_idx]:
+                        col_widths[c_idx] = len(str(value))
         
         # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
+        for c_idx, max_length in enumerate(col_widths, 1):
             adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            ws.column_dimensions[column_letter].width = adjusted_width
+            ws.column_dimensions[get_column_letter(c_idx)].width = adjusted_width
+        
+        # Style and append one row at a time, so only the current row's
+        # cells are alive
+        for r_idx, row in enumerate(rows, 1):
+            row_cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                
+                # Style headers
+                if r_idx == 1:
+                    cell.font = self._header_font
+                    cell.fill = self._header_fill
+                else:
+                    # Style data rows
+                    if r_idx % 2 == 0:
+                        cell.fill = self._zebra_fill
+                
+                row_cells.append(cell)
+            ws.append(row_cells)
     
     def _write_metadata_sheet(self, wb: Any, result: ProcessingResult) -> None:
         """Write metadata to separate sheet."""
-        if Font is None:
+        if WriteOnlyCell is None:
             raise ImportError("openpyxl is required for structured Excel writing")
             
         ws = wb.create_sheet(title="Metadata")
         
+        # Column widths must be set before the first row is streamed
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 50
+        
         # Write metadata
-        row = 1
-        ws.cell(row=row, column=1, value="Processing Metadata")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=14)
-        row += 2
+        title = WriteOnlyCell(ws, value="Processing Metadata")
+        title.font = self._title_font
+        ws.append([title])
+        ws.append([])
         
         metadata = result.metadata
         for key, value in metadata.items():
-            ws.cell(row=row, column=1, value=str(key))
-            ws.cell(row=row, column=1).font = Font(bold=True)
-            ws.cell(row=row, column=2, value=str(value))
-            row += 1
-        
-        # Auto-adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 50 
\ No newline at end of file
+            label = WriteOnlyCell(ws, value=str(key))
+            label.font = self._label_font
+            ws.append([label, str(value)]) 
\ No newline at end of file
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
 import re
 import shutil
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 try:
     import pandas as pd
@@ -21,6 +29,19 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+# Slice/buffer size used when hashing files
+_HASH_CHUNK_SIZE = 1 << 20
+# Files below this size are hashed from a single memory map
+_HASH_MMAP_MAX_SIZE = 64 << 20
+
+# Characters not allowed in file names and Excel sheet names
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+_SHEETNAME_BAD_RE = re.compile(r'[\\/*?:\[\]]')
+
+# Page numbers NumPy can expand; end + 1 must also fit, hence the open bound
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
 
 def generate_job_id() -> str:
     """Generate a unique job identifier."""
@@ -75,8 +96,7 @@ def validate_pdf_file(file_path: Path) -> Tuple[bool, Optional[str]]:
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file system operations."""
     # Remove or replace invalid characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    sanitized = _SANITIZE_RE.sub('_', filename)
     
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(' .')
@@ -110,7 +130,17 @@ def parse_page_range(page_range: str) -> List[int]:
     if not page_range:
         return []
     
-    pages = set()
+    # Parsing (and its warnings) runs on every call; only the expansion is cached
+    spans, singles = _split_page_range(page_range)
+    
+    # Callers get their own list; the cached result is shared
+    return list(_expand_page_range(spans, singles))
+
+
+def _split_page_range(page_range: str) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[int, ...]]:
+    """Split a page range string into (start, end) spans and single pages."""
+    spans = []
+    singles = []
     parts = page_range.split(',')
     
     for part in parts:
@@ -118,29 +148,81 @@ def parse_page_range(page_range: str) -> List[int]:
         if '-' in part:
             start, end = part.split('-')
             try:
-                start_num = int(start.strip())
-                end_num = int(end.strip())
-                pages.update(range(start_num, end_num + 1))
+                spans.append((int(start.strip()), int(end.strip())))
             except ValueError:
                 logger.warning(f"Invalid page range: {part}")
         else:
             try:
-                pages.add(int(part))
+                singles.append(int(part))
             except ValueError:
                 logger.warning(f"Invalid page number: {part}")
     
-    return sorted(list(pages))
+    return tuple(spans), tuple(singles)
+
+
+@lru_cache(maxsize=256)
+def _expand_page_range(
+    spans: Tuple[Tuple[int, int], ...], singles: Tuple[int, ...]
+) -> Tuple[int, ...]:
+    """Expand spans and single pages into a sorted tuple of unique page numbers.
+    
+    Results are cached, since batch jobs commonly repeat the same range.
+    """
+    # Expand and deduplicate in NumPy so wide ranges never box each page as a
+    # Python int; numbers outside int64 take the pure Python path
+    values = [*singles, *(bound for span in spans for bound in span)]
+    if np is not None and all(_INT64_MIN <= value < _INT64_MAX for value in values):
+        arrays = [np.arange(start, end + 1, dtype=np.int64) for start, end in spans]
+        arrays.append(np.asarray(singles, dtype=np.int64))
+        return tuple(np.unique(np.concatenate(arrays)).tolist())
+    
+    pages = set(singles)
+    for start, end in spans:
+        pages.update(range(start, end + 1))
+    return tuple(sorted(pages))
 
 
 def calculate_file_hash(file_path: Path) -> str:
     """Calculate SHA-256 hash of a file."""
-    hash_sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
+        # Small files are memory-mapped and hashed in a single call
+        # (empty files cannot be memory-mapped)
+        if 0 < os.fstat(f.fileno()).st_size < _HASH_MMAP_MAX_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        
+        # Python 3.11+ hashes the file in C with a large buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        hash_sha256 = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hash_sha256.update(view[:size])
     return hash_sha256.hexdigest()
 
 
+def calculate_file_fingerprint(file_path: Path) -> str:
+    """Calculate a BLAKE2b (128-bit) fingerprint of a file.
+    
+    The file is memory-mapped and hashed in 1 MiB slices, so memory use stays
+    constant regardless of file size.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return hasher.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, len(mm), _HASH_CHUNK_SIZE):
+                hasher.update(mm[offset:offset + _HASH_CHUNK_SIZE])
+    return hasher.hexdigest()
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes == 0:
@@ -156,6 +238,33 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_float:.1f} {size_names[i]}"
 
 
+def format_file_sizes(sizes: Sequence[int]) -> List[str]:
+    """Format many file sizes at once, same output as format_file_size.
+    
+    Args:
+        sizes: File sizes in bytes
+    
+    Returns:
+        Human-readable sizes, in input order
+    """
+    if np is None:
+        return [format_file_size(size) for size in sizes]
+    
+    size_names = np.array(["B", "KB", "MB", "GB", "TB"])
+    values = np.asarray(sizes, dtype=np.float64)
+    
+    # Unit index is floor(log2(size) / 10), clipped to the known units;
+    # dividing by a power of two is exact, so this matches the scalar loop
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_index = np.floor(np.log2(np.maximum(values, 1.0)) / 10)
+    unit_index = np.clip(unit_index, 0, len(size_names) - 1).astype(np.int64)
+    scaled = values / np.power(1024.0, unit_index)
+    
+    formatted = np.char.add(np.char.add(np.char.mod("%.1f", scaled), " "), size_names[unit_index])
+    formatted[values == 0] = "0 B"
+    return formatted.tolist()
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable format."""
     if seconds < 60:
@@ -201,23 +310,11 @@ def merge_dataframes(dfs: List[pd.DataFrame], strategy: str = "concat") -> pd.Da
     if strategy == "concat":
         return pd.concat(dfs, ignore_index=True)
     elif strategy == "union":
-        # Union of all columns
-        all_columns = set()
-        for df in dfs:
-            all_columns.update(df.columns)
-        
-        # Add missing columns to each dataframe
-        for df in dfs:
-            for col in all_columns:
-                if col not in df.columns:
-                    df[col] = None
-        
-        return pd.concat(dfs, ignore_index=True)
+        # concat already outer-joins the columns; missing values become NaN
+        return pd.concat(dfs, ignore_index=True, sort=False)
     elif strategy == "intersection":
         # Only common columns
-        common_columns = set(dfs[0].columns)
-        for df in dfs[1:]:
-            common_columns &= set(df.columns)
+        common_columns = set.intersection(*(set(df.columns) for df in dfs))
         
         if not common_columns:
             return pd.DataFrame()
@@ -233,13 +330,15 @@ def detect_table_structure(df: pd.DataFrame) -> Dict[str, Any]:
     if df.empty:
         return {"type": "empty", "rows": 0, "columns": 0}
     
+    dtypes = df.dtypes
     structure = {
         "type": "table",
         "rows": len(df),
         "columns": len(df.columns),
-        "column_types": df.dtypes.to_dict(),
+        "column_types": dtypes.to_dict(),
         "has_headers": True,  # Assume first row is header
-        "empty_cells": df.isnull().sum().sum(),
+        # One reduction over the whole null mask instead of one per column
+        "empty_cells": int(df.isna().to_numpy().sum()),
         "total_cells": df.size,
     }
     
@@ -248,8 +347,9 @@ def detect_table_structure(df: pd.DataFrame) -> Dict[str, Any]:
         structure["type"] = "simple_list"
     
     # Check for common table patterns
-    numeric_columns = df.select_dtypes(include=['number']).columns
-    if len(numeric_columns) > len(df.columns) * 0.5:
+    # Same columns select_dtypes(include=['number']) picks, read off the dtype kinds
+    numeric_count = sum(1 for dtype in dtypes if dtype.kind in "iufcm")
+    if numeric_count > len(df.columns) * 0.5:
         structure["type"] = "data_table"
     
     return structure
@@ -283,8 +383,7 @@ def validate_excel_output_options(options: Dict[str, Any]) -> Tuple[bool, Option
                 return False, "Sheet name must be 1-31 characters long"
             
             # Check for invalid characters in sheet name
-            invalid_chars = r'[\\/*?:\[\]]'
-            if re.search(invalid_chars, sheet_name):
+            if _SHEETNAME_BAD_RE.search(sheet_name):
                 return False, "Sheet name contains invalid characters"
         
         return True, None
@@ -2,17 +2,68 @@
 """
 Database query script to demonstrate the stored PDF processing data.
 This script shows how to retrieve and analyze the comprehensive data stored in the database.
+
+The only writes it makes are to the stats_cache table: statistics computed
+during a report are stored, in one commit, once the report is complete.
 """
 
+import functools
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List
+
+from sqlalchemy import String, case, cast, func
+from sqlalchemy.orm import Session, joinedload
 
 # Add the pdf_converter package to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from pdf_converter.database import DatabaseManager
-from pdf_converter.utils import format_file_size, format_duration
+from pdf_converter.database.models import (
+    ExtractedTableDB, ExtractedTextDB, FileHashDB, PDFMetadataDB, ProcessingJobDB
+)
+from pdf_converter.utils import format_file_size, format_file_sizes, format_duration
+
+# Rows fetched per round trip when streaming potentially long listings
+_STREAM_BATCH_SIZE = 1000
+
+# Cached statistics older than this many seconds are recomputed; saving or
+# cleaning up jobs clears the cache immediately
+_STATS_CACHE_TTL = 3600
+
+# Icon shown per job status; any other status counts as in progress
+_STATUS_ICONS = {"completed": "✅", "failed": "❌"}
+_DEFAULT_STATUS_ICON = "🔄"
+
+
+def _timestamp_text(column: Any, dialect_name: str) -> Any:
+    """SQL expression rendering a DateTime column as 'YYYY-MM-DD HH:MM:SS'."""
+    if dialect_name == "sqlite":
+        return func.strftime("%Y-%m-%d %H:%M:%S", column)
+    if dialect_name == "postgresql":
+        return func.to_char(column, "YYYY-MM-DD HH24:MI:SS")
+    # Other backends render timestamps in ISO order; drop any fractional seconds
+    return func.substr(cast(column, String), 1, 19)
+
+
+def _write_lines(method: Callable[..., Iterator[str]]) -> Callable[..., None]:
+    """Write the lines yielded by a report section to stdout in batches.
+    
+    Sections yield their lines instead of printing them one by one. Up to
+    _STREAM_BATCH_SIZE lines go out per stdout write, so a streamed listing
+    is never held in memory as a whole.
+    """
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        lines = method(*args, **kwargs)
+        while True:
+            batch = list(islice(lines, _STREAM_BATCH_SIZE))
+            if not batch:
+                break
+            sys.stdout.write("".join(f"{line}\n" for line in batch))
+    
+    return wrapper
 
 
 class DatabaseAnalyzer:
@@ -21,345 +72,460 @@ class DatabaseAnalyzer:
     def __init__(self) -> None:
         """Initialize the database analyzer."""
         self.db_manager = DatabaseManager()
+        # Statistics computed during the current report, cached once it ends
+        self._pending_stats: Dict[str, Dict[str, Any]] = {}
     
     def analyze_database(self) -> None:
         """Perform comprehensive database analysis."""
         print("=== PDF Processing Database Analysis ===")
         print()
         
-        # Get basic statistics
-        self._show_basic_statistics()
-        
-        # Show recent jobs
-        self._show_recent_jobs()
-        
-        # Show file processing history
-        self._show_file_history()
-        
-        # Show text extraction analysis
-        self._show_text_analysis()
-        
-        # Show table extraction analysis
-        self._show_table_analysis()
+        # All sections share one session
+        with self.db_manager.get_session() as session:
+            # Get basic statistics
+            self._show_basic_statistics(session)
+            
+            # Show recent jobs
+            self._show_recent_jobs(session)
+            
+            # Show file processing history
+            self._show_file_history(session)
+            
+            # Show text extraction analysis
+            self._show_text_analysis(session)
+            
+            # Show table extraction analysis
+            self._show_table_analysis(session)
+            
+            # Show metadata analysis
+            self._show_metadata_analysis(session)
+            
+            # Show duplicate files
+            self._show_duplicate_files(session)
+            
+            # Cache newly computed statistics after every section has read
+            self._store_pending_stats(session)
+    
+    def _cached_stats(
+        self, session: Session, key: str, compute: Callable[[Session], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Get statistics from the stats cache, computing them if missing or stale.
         
-        # Show metadata analysis
-        self._show_metadata_analysis()
+        Computed statistics are queued and written by _store_pending_stats.
+        """
+        stats = self.db_manager.get_cached_stats(session, key, _STATS_CACHE_TTL)
+        if stats is None:
+            stats = compute(session)
+            self._pending_stats[key] = stats
+        return stats
+    
+    def _store_pending_stats(self, session: Session) -> None:
+        """Write the statistics computed during this report to the stats cache."""
+        if not self._pending_stats:
+            return
         
-        # Show duplicate files
-        self._show_duplicate_files()
+        try:
+            self.db_manager.store_cached_stats(session, self._pending_stats)
+        except Exception as e:
+            session.rollback()
+            print(f"Error caching statistics: {e}")
+        finally:
+            self._pending_stats = {}
     
-    def _show_basic_statistics(self) -> None:
+    @_write_lines
+    def _show_basic_statistics(self, session: Session) -> Iterator[str]:
         """Show basic processing statistics."""
-        print("📊 BASIC STATISTICS")
-        print("-" * 40)
+        yield "📊 BASIC STATISTICS"
+        yield "-" * 40
         
         try:
-            stats = self.db_manager.get_job_statistics()
+            stats = self._cached_stats(session, "basic_statistics", self.db_manager.get_job_statistics)
             
-            print(f"Total processing jobs: {stats['total_jobs']}")
-            print(f"Completed jobs: {stats['completed_jobs']}")
-            print(f"Failed jobs: {stats['failed_jobs']}")
-            print(f"Success rate: {stats['success_rate']:.1f}%")
-            print(f"Total files processed: {stats['total_files_processed']}")
-            print(f"Total text blocks: {stats['total_text_blocks']:,}")
-            print(f"Total tables: {stats['total_tables']:,}")
+            yield f"Total processing jobs: {stats['total_jobs']}"
+            yield f"Completed jobs: {stats['completed_jobs']}"
+            yield f"Failed jobs: {stats['failed_jobs']}"
+            yield f"Success rate: {stats['success_rate']:.1f}%"
+            yield f"Total files processed: {stats['total_files_processed']}"
+            yield f"Total text blocks: {stats['total_text_blocks']:,}"
+            yield f"Total tables: {stats['total_tables']:,}"
             
         except Exception as e:
-            print(f"Error retrieving statistics: {e}")
+            yield f"Error retrieving statistics: {e}"
         
-        print()
+        yield ""
     
-    def _show_recent_jobs(self) -> None:
+    @_write_lines
+    def _show_recent_jobs(self, session: Session) -> Iterator[str]:
         """Show recent processing jobs."""
-        print("📋 RECENT PROCESSING JOBS")
-        print("-" * 40)
+        yield "📋 RECENT PROCESSING JOBS"
+        yield "-" * 40
         
         try:
-            recent_jobs = self.db_manager.get_recent_jobs(10)
+            # Select only the displayed columns, with created_at already
+            # formatted by the database
+            recent_jobs = session.query(
+                ProcessingJobDB.job_id,
+                ProcessingJobDB.input_file_name,
+                ProcessingJobDB.input_file_size,
+                ProcessingJobDB.status,
+                _timestamp_text(ProcessingJobDB.created_at, session.bind.dialect.name).label("created_text"),
+                ProcessingJobDB.pages_processed,
+                ProcessingJobDB.tables_extracted,
+                ProcessingJobDB.text_blocks_extracted,
+                ProcessingJobDB.processing_time
+            ).order_by(
+                ProcessingJobDB.created_at.desc()
+            ).limit(10).all()
             
             if not recent_jobs:
-                print("No jobs found in database.")
+                yield "No jobs found in database."
                 return
             
             for job in recent_jobs:
-                status_icon = "✅" if job.status == "completed" else "❌" if job.status == "failed" else "🔄"
-                print(f"{status_icon} {job.job_id}")
-                print(f"   File: {job.input_file_name}")
-                print(f"   Size: {format_file_size(job.input_file_size)}")
-                print(f"   Status: {job.status}")
-                print(f"   Created: {job.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"   Pages: {job.pages_processed}, Tables: {job.tables_extracted}, Text: {job.text_blocks_extracted}")
+                status_icon = _STATUS_ICONS.get(job.status, _DEFAULT_STATUS_ICON)
+                yield f"{status_icon} {job.job_id}"
+                yield f"   File: {job.input_file_name}"
+                yield f"   Size: {format_file_size(job.input_file_size)}"
+                yield f"   Status: {job.status}"
+                yield f"   Created: {job.created_text}"
+                yield f"   Pages: {job.pages_processed}, Tables: {job.tables_extracted}, Text: {job.text_blocks_extracted}"
                 if job.processing_time:
-                    print(f"   Time: {format_duration(job.processing_time)}")
-                print()
+                    yield f"   Time: {format_duration(job.processing_time)}"
+                yield ""
             
         except Exception as e:
-            print(f"Error retrieving recent jobs: {e}")
+            yield f"Error retrieving recent jobs: {e}"
     
-    def _show_file_history(self) -> None:
+    @_write_lines
+    def _show_file_history(self, session: Session) -> Iterator[str]:
         """Show file processing history."""
-        print("📁 FILE PROCESSING HISTORY")
-        print("-" * 40)
+        yield "📁 FILE PROCESSING HISTORY"
+        yield "-" * 40
         
         try:
-            with self.db_manager.get_session() as session:
-                # Get all processed files
-                from pdf_converter.database.models import ProcessingJobDB
-                
-                files = session.query(ProcessingJobDB).order_by(
-                    ProcessingJobDB.created_at.desc()
-                ).all()
-                
-                if not files:
-                    print("No files processed yet.")
-                    return
-                
-                # Group by file name
-                file_groups = {}
-                for job in files:
-                    file_name = job.input_file_name
-                    if file_name not in file_groups:
-                        file_groups[file_name] = []
-                    file_groups[file_name].append(job)
-                
-                for file_name, jobs in file_groups.items():
-                    print(f"📄 {file_name}")
-                    print(f"   Processed {len(jobs)} times")
-                    print(f"   First: {jobs[-1].created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                    print(f"   Last: {jobs[0].created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                    print(f"   Size: {format_file_size(jobs[0].input_file_size)}")
-                    
-                    # Show success rate
-                    completed = sum(1 for job in jobs if job.status == "completed")
-                    success_rate = (completed / len(jobs)) * 100
-                    print(f"   Success rate: {success_rate:.1f}%")
-                    print()
+            # One row per file name, most recently processed first
+            file_groups = session.query(
+                ProcessingJobDB.input_file_name,
+                func.count(ProcessingJobDB.id),
+                func.min(ProcessingJobDB.created_at),
+                func.max(ProcessingJobDB.created_at),
+                func.max(ProcessingJobDB.input_file_size),
+                func.sum(case((ProcessingJobDB.status == "completed", 1), else_=0))
+            ).group_by(
+                ProcessingJobDB.input_file_name
+            ).order_by(
+                func.max(ProcessingJobDB.created_at).desc()
+            ).all()
+            
+            if not file_groups:
+                yield "No files processed yet."
+                return
+            
+            # Format every size in one vectorized call rather than per row
+            file_sizes = format_file_sizes([group[4] for group in file_groups])
             
+            for (file_name, job_count, first_at, last_at, _, completed), file_size in zip(file_groups, file_sizes):
+                yield f"📄 {file_name}"
+                yield f"   Processed {job_count} times"
+                yield f"   First: {first_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                yield f"   Last: {last_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                yield f"   Size: {file_size}"
+                
+                # Show success rate
+                success_rate = (completed / job_count) * 100
+                yield f"   Success rate: {success_rate:.1f}%"
+                yield ""
+        
         except Exception as e:
-            print(f"Error retrieving file history: {e}")
+            yield f"Error retrieving file history: {e}"
     
-    def _show_text_analysis(self) -> None:
+    @_write_lines
+    def _show_text_analysis(self, session: Session) -> Iterator[str]:
         """Show text extraction analysis."""
-        print("📝 TEXT EXTRACTION ANALYSIS")
-        print("-" * 40)
+        yield "📝 TEXT EXTRACTION ANALYSIS"
+        yield "-" * 40
         
         try:
-            with self.db_manager.get_session() as session:
-                from pdf_converter.database.models import ExtractedTextDB
-                
-                # Get text statistics
-                total_texts = session.query(ExtractedTextDB).count()
-                if total_texts == 0:
-                    print("No text data found.")
-                    return
-                
-                # Get text with most words
-                longest_text = session.query(ExtractedTextDB).order_by(
-                    ExtractedTextDB.word_count.desc()
-                ).first()
-                
-                # Get text with most characters
-                largest_text = session.query(ExtractedTextDB).order_by(
-                    ExtractedTextDB.text_length.desc()
-                ).first()
-                
-                # Get average statistics
-                avg_word_count = session.query(ExtractedTextDB.word_count).all()
-                avg_word_count = sum(wc[0] for wc in avg_word_count) / len(avg_word_count)
-                
-                avg_text_length = session.query(ExtractedTextDB.text_length).all()
-                avg_text_length = sum(tl[0] for tl in avg_text_length) / len(avg_text_length)
-                
-                print(f"Total text blocks: {total_texts:,}")
-                print(f"Average word count: {avg_word_count:.0f}")
-                print(f"Average text length: {avg_text_length:.0f} characters")
-                
-                if longest_text:
-                    print(f"Longest text: {longest_text.word_count:,} words")
-                    print(f"   From job: {longest_text.job.job_id}")
-                    print(f"   Page: {longest_text.page_number}")
-                
-                if largest_text:
-                    print(f"Largest text: {largest_text.text_length:,} characters")
-                    print(f"   From job: {largest_text.job.job_id}")
-                    print(f"   Page: {largest_text.page_number}")
-                
-                # Show content type analysis
-                texts_with_numbers = session.query(ExtractedTextDB).filter_by(has_numbers=True).count()
-                texts_with_emails = session.query(ExtractedTextDB).filter_by(has_emails=True).count()
-                texts_with_urls = session.query(ExtractedTextDB).filter_by(has_urls=True).count()
-                texts_with_phones = session.query(ExtractedTextDB).filter_by(has_phone_numbers=True).count()
-                
-                print(f"\nContent Analysis:")
-                print(f"   Contains numbers: {texts_with_numbers:,} ({texts_with_numbers/total_texts*100:.1f}%)")
-                print(f"   Contains emails: {texts_with_emails:,} ({texts_with_emails/total_texts*100:.1f}%)")
-                print(f"   Contains URLs: {texts_with_urls:,} ({texts_with_urls/total_texts*100:.1f}%)")
-                print(f"   Contains phone numbers: {texts_with_phones:,} ({texts_with_phones/total_texts*100:.1f}%)")
+            stats = self._cached_stats(session, "text_analysis", self._compute_text_statistics)
+            total_texts = stats["total_texts"]
+            if total_texts == 0:
+                yield "No text data found."
+                return
             
+            yield f"Total text blocks: {total_texts:,}"
+            yield f"Average word count: {stats['avg_word_count']:.0f}"
+            yield f"Average text length: {stats['avg_text_length']:.0f} characters"
+            
+            longest_text = stats["longest_text"]
+            if longest_text:
+                yield f"Longest text: {longest_text['word_count']:,} words"
+                yield f"   From job: {longest_text['job_id']}"
+                yield f"   Page: {longest_text['page_number']}"
+            
+            largest_text = stats["largest_text"]
+            if largest_text:
+                yield f"Largest text: {largest_text['text_length']:,} characters"
+                yield f"   From job: {largest_text['job_id']}"
+                yield f"   Page: {largest_text['page_number']}"
+            
+            # Show content type analysis
+            texts_with_numbers = stats["texts_with_numbers"]
+            texts_with_emails = stats["texts_with_emails"]
+            texts_with_urls = stats["texts_with_urls"]
+            texts_with_phones = stats["texts_with_phones"]
+            yield f"\nContent Analysis:"
+            yield f"   Contains numbers: {texts_with_numbers:,} ({texts_with_numbers/total_texts*100:.1f}%)"
+            yield f"   Contains emails: {texts_with_emails:,} ({texts_with_emails/total_texts*100:.1f}%)"
+            yield f"   Contains URLs: {texts_with_urls:,} ({texts_with_urls/total_texts*100:.1f}%)"
+            yield f"   Contains phone numbers: {texts_with_phones:,} ({texts_with_phones/total_texts*100:.1f}%)"
+        
         except Exception as e:
-            print(f"Error analyzing text data: {e}")
+            yield f"Error analyzing text data: {e}"
         
-        print()
+        yield ""
     
-    def _show_table_analysis(self) -> None:
+    def _compute_text_statistics(self, session: Session) -> Dict[str, Any]:
+        """Compute the text extraction statistics shown by _show_text_analysis."""
+        # Get text statistics and content flag counts in one aggregate query
+        (
+            total_texts, avg_word_count, avg_text_length,
+            texts_with_numbers, texts_with_emails, texts_with_urls, texts_with_phones
+        ) = session.query(
+            func.count(ExtractedTextDB.id),
+            func.avg(ExtractedTextDB.word_count),
+            func.avg(ExtractedTextDB.text_length),
+            func.sum(case((ExtractedTextDB.has_numbers, 1), else_=0)),
+            func.sum(case((ExtractedTextDB.has_emails, 1), else_=0)),
+            func.sum(case((ExtractedTextDB.has_urls, 1), else_=0)),
+            func.sum(case((ExtractedTextDB.has_phone_numbers, 1), else_=0))
+        ).one()
+        if total_texts == 0:
+            return {"total_texts": 0}
+        
+        # Get text with most words (with its job in the same query)
+        longest_text = session.query(ExtractedTextDB).options(
+            joinedload(ExtractedTextDB.job)
+        ).order_by(
+            ExtractedTextDB.word_count.desc()
+        ).first()
+        
+        # Get text with most characters
+        largest_text = session.query(ExtractedTextDB).options(
+            joinedload(ExtractedTextDB.job)
+        ).order_by(
+            ExtractedTextDB.text_length.desc()
+        ).first()
+        
+        # Plain numbers only, so the result can be stored as JSON
+        return {
+            "total_texts": int(total_texts),
+            "avg_word_count": float(avg_word_count),
+            "avg_text_length": float(avg_text_length),
+            "longest_text": {
+                "word_count": longest_text.word_count,
+                "job_id": longest_text.job.job_id,
+                "page_number": longest_text.page_number,
+            } if longest_text else None,
+            "largest_text": {
+                "text_length": largest_text.text_length,
+                "job_id": largest_text.job.job_id,
+                "page_number": largest_text.page_number,
+            } if largest_text else None,
+            "texts_with_numbers": int(texts_with_numbers),
+            "texts_with_emails": int(texts_with_emails),
+            "texts_with_urls": int(texts_with_urls),
+            "texts_with_phones": int(texts_with_phones),
+        }
+    
+    @_write_lines
+    def _show_table_analysis(self, session: Session) -> Iterator[str]:
         """Show table extraction analysis."""
-        print("📋 TABLE EXTRACTION ANALYSIS")
-        print("-" * 40)
+        yield "📋 TABLE EXTRACTION ANALYSIS"
+        yield "-" * 40
         
         try:
-            with self.db_manager.get_session() as session:
-                from pdf_converter.database.models import ExtractedTableDB
-                
-                # Get table statistics
-                total_tables = session.query(ExtractedTableDB).count()
-                if total_tables == 0:
-                    print("No table data found.")
-                    return
-                
-                # Get largest table
-                largest_table = session.query(ExtractedTableDB).order_by(
-                    ExtractedTableDB.total_cells.desc()
-                ).first()
-                
-                # Get average statistics
-                avg_rows = session.query(ExtractedTableDB.rows).all()
-                avg_rows = sum(r[0] for r in avg_rows) / len(avg_rows)
-                
-                avg_cols = session.query(ExtractedTableDB.columns).all()
-                avg_cols = sum(c[0] for c in avg_cols) / len(avg_cols)
-                
-                print(f"Total tables: {total_tables:,}")
-                print(f"Average size: {avg_rows:.1f} rows × {avg_cols:.1f} columns")
-                
-                if largest_table:
-                    print(f"Largest table: {largest_table.rows} rows × {largest_table.columns} columns")
-                    print(f"   Total cells: {largest_table.total_cells:,}")
-                    print(f"   From job: {largest_table.job.job_id}")
-                    print(f"   Page: {largest_table.page_number}")
-                
-                # Show table types
-                table_types = session.query(ExtractedTableDB.table_type).all()
-                type_counts = {}
-                for tt in table_types:
-                    type_counts[tt[0]] = type_counts.get(tt[0], 0) + 1
-                
-                print(f"\nTable Types:")
-                for table_type, count in type_counts.items():
-                    print(f"   {table_type}: {count:,} ({count/total_tables*100:.1f}%)")
-                
-                # Show data type analysis
-                tables_with_numeric = session.query(ExtractedTableDB).filter_by(has_numeric_data=True).count()
-                tables_with_dates = session.query(ExtractedTableDB).filter_by(has_date_data=True).count()
-                tables_with_currency = session.query(ExtractedTableDB).filter_by(has_currency_data=True).count()
-                
-                print(f"\nData Type Analysis:")
-                print(f"   Contains numeric data: {tables_with_numeric:,} ({tables_with_numeric/total_tables*100:.1f}%)")
-                print(f"   Contains date data: {tables_with_dates:,} ({tables_with_dates/total_tables*100:.1f}%)")
-                print(f"   Contains currency data: {tables_with_currency:,} ({tables_with_currency/total_tables*100:.1f}%)")
+            stats = self._cached_stats(session, "table_analysis", self._compute_table_statistics)
+            total_tables = stats["total_tables"]
+            if total_tables == 0:
+                yield "No table data found."
+                return
+            
+            yield f"Total tables: {total_tables:,}"
+            yield f"Average size: {stats['avg_rows']:.1f} rows × {stats['avg_cols']:.1f} columns"
+            
+            largest_table = stats["largest_table"]
+            if largest_table:
+                yield f"Largest table: {largest_table['rows']} rows × {largest_table['columns']} columns"
+                yield f"   Total cells: {largest_table['total_cells']:,}"
+                yield f"   From job: {largest_table['job_id']}"
+                yield f"   Page: {largest_table['page_number']}"
             
+            # Show table types
+            yield f"\nTable Types:"
+            for table_type, count in stats["table_types"]:
+                yield f"   {table_type}: {count:,} ({count/total_tables*100:.1f}%)"
+            
+            # Show data type analysis
+            tables_with_numeric = stats["tables_with_numeric"]
+            tables_with_dates = stats["tables_with_dates"]
+            tables_with_currency = stats["tables_with_currency"]
+            yield f"\nData Type Analysis:"
+            yield f"   Contains numeric data: {tables_with_numeric:,} ({tables_with_numeric/total_tables*100:.1f}%)"
+            yield f"   Contains date data: {tables_with_dates:,} ({tables_with_dates/total_tables*100:.1f}%)"
+            yield f"   Contains currency data: {tables_with_currency:,} ({tables_with_currency/total_tables*100:.1f}%)"
+        
         except Exception as e:
-            print(f"Error analyzing table data: {e}")
+            yield f"Error analyzing table data: {e}"
         
-        print()
+        yield ""
     
-    def _show_metadata_analysis(self) -> None:
+    def _compute_table_statistics(self, session: Session) -> Dict[str, Any]:
+        """Compute the table extraction statistics shown by _show_table_analysis."""
+        # Get table statistics and data type flag counts in one aggregate query
+        (
+            total_tables, avg_rows, avg_cols,
+            tables_with_numeric, tables_with_dates, tables_with_currency
+        ) = session.query(
+            func.count(ExtractedTableDB.id),
+            func.avg(ExtractedTableDB.rows),
+            func.avg(ExtractedTableDB.columns),
+            func.sum(case((ExtractedTableDB.has_numeric_data, 1), else_=0)),
+            func.sum(case((ExtractedTableDB.has_date_data, 1), else_=0)),
+            func.sum(case((ExtractedTableDB.has_currency_data, 1), else_=0))
+        ).one()
+        if total_tables == 0:
+            return {"total_tables": 0}
+        
+        # Get largest table (with its job in the same query)
+        largest_table = session.query(ExtractedTableDB).options(
+            joinedload(ExtractedTableDB.job)
+        ).order_by(
+            ExtractedTableDB.total_cells.desc()
+        ).first()
+        
+        type_counts = session.query(
+            ExtractedTableDB.table_type, func.count(ExtractedTableDB.id)
+        ).group_by(ExtractedTableDB.table_type).order_by(ExtractedTableDB.table_type).all()
+        
+        # Plain numbers and lists only, so the result can be stored as JSON
+        return {
+            "total_tables": int(total_tables),
+            "avg_rows": float(avg_rows),
+            "avg_cols": float(avg_cols),
+            "largest_table": {
+                "rows": largest_table.rows,
+                "columns": largest_table.columns,
+                "total_cells": largest_table.total_cells,
+                "job_id": largest_table.job.job_id,
+                "page_number": largest_table.page_number,
+            } if largest_table else None,
+            "table_types": [[table_type, int(count)] for table_type, count in type_counts],
+            "tables_with_numeric": int(tables_with_numeric),
+            "tables_with_dates": int(tables_with_dates),
+            "tables_with_currency": int(tables_with_currency),
+        }
+    
+    @_write_lines
+    def _show_metadata_analysis(self, session: Session) -> Iterator[str]:
         """Show PDF metadata analysis."""
-        print("📄 PDF METADATA ANALYSIS")
-        print("-" * 40)
+        yield "📄 PDF METADATA ANALYSIS"
+        yield "-" * 40
         
         try:
-            with self.db_manager.get_session() as session:
-                from pdf_converter.database.models import PDFMetadataDB
-                
-                # Get metadata statistics
-                total_metadata = session.query(PDFMetadataDB).count()
-                if total_metadata == 0:
-                    print("No metadata found.")
-                    return
-                
-                print(f"Total PDFs with metadata: {total_metadata}")
-                
-                # Show metadata availability
-                with_title = session.query(PDFMetadataDB).filter(PDFMetadataDB.title.isnot(None)).count()
-                with_author = session.query(PDFMetadataDB).filter(PDFMetadataDB.author.isnot(None)).count()
-                with_subject = session.query(PDFMetadataDB).filter(PDFMetadataDB.subject.isnot(None)).count()
-                with_creator = session.query(PDFMetadataDB).filter(PDFMetadataDB.creator.isnot(None)).count()
-                
-                print(f"\nMetadata Availability:")
-                print(f"   Title: {with_title:,} ({with_title/total_metadata*100:.1f}%)")
-                print(f"   Author: {with_author:,} ({with_author/total_metadata*100:.1f}%)")
-                print(f"   Subject: {with_subject:,} ({with_subject/total_metadata*100:.1f}%)")
-                print(f"   Creator: {with_creator:,} ({with_creator/total_metadata*100:.1f}%)")
-                
-                # Show some sample titles
-                titles = session.query(PDFMetadataDB.title).filter(
-                    PDFMetadataDB.title.isnot(None)
-                ).limit(5).all()
-                
-                if titles:
-                    print(f"\nSample Titles:")
-                    for title in titles:
-                        if title[0]:
-                            print(f"   - {title[0]}")
+            # Get metadata statistics in one aggregate query; COUNT(column)
+            # only counts rows where the column is not NULL
+            total_metadata, with_title, with_author, with_subject, with_creator = session.query(
+                func.count(PDFMetadataDB.id),
+                func.count(PDFMetadataDB.title),
+                func.count(PDFMetadataDB.author),
+                func.count(PDFMetadataDB.subject),
+                func.count(PDFMetadataDB.creator)
+            ).one()
+            if total_metadata == 0:
+                yield "No metadata found."
+                return
+            
+            yield f"Total PDFs with metadata: {total_metadata}"
             
+            # Show metadata availability
+            yield f"\nMetadata Availability:"
+            yield f"   Title: {with_title:,} ({with_title/total_metadata*100:.1f}%)"
+            yield f"   Author: {with_author:,} ({with_author/total_metadata*100:.1f}%)"
+            yield f"   Subject: {with_subject:,} ({with_subject/total_metadata*100:.1f}%)"
+            yield f"   Creator: {with_creator:,} ({with_creator/total_metadata*100:.1f}%)"
+            
+            # Show some sample titles
+            titles = session.query(PDFMetadataDB.title).filter(
+                PDFMetadataDB.title.isnot(None)
+            ).limit(5).all()
+            
+            if titles:
+                yield f"\nSample Titles:"
+                for title in titles:
+                    if title[0]:
+                        yield f"   - {title[0]}"
+        
         except Exception as e:
-            print(f"Error analyzing metadata: {e}")
+            yield f"Error analyzing metadata: {e}"
         
-        print()
+        yield ""
     
-    def _show_duplicate_files(self) -> None:
+    @_write_lines
+    def _show_duplicate_files(self, session: Session) -> Iterator[str]:
         """Show duplicate file processing."""
-        print("🔄 DUPLICATE FILE ANALYSIS")
-        print("-" * 40)
+        yield "🔄 DUPLICATE FILE ANALYSIS"
+        yield "-" * 40
         
         try:
-            duplicates = self.db_manager.get_duplicate_files()
+            is_duplicate = FileHashDB.processing_count > 1
+            duplicate_count = session.query(func.count(FileHashDB.id)).filter(is_duplicate).scalar()
             
-            if not duplicates:
-                print("No duplicate files found.")
+            if duplicate_count == 0:
+                yield "No duplicate files found."
                 return
             
-            print(f"Found {len(duplicates)} files processed multiple times:")
+            yield f"Found {duplicate_count} files processed multiple times:"
             
-            for dup in duplicates:
-                print(f"📄 {dup.file_name}")
-                print(f"   Processed {dup.processing_count} times")
-                print(f"   First: {dup.first_processed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"   Last: {dup.last_processed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"   Size: {format_file_size(dup.file_size)}")
-                print()
+            # Stream the rows in batches rather than loading the whole list
+            duplicates = session.query(FileHashDB).filter(is_duplicate).order_by(
+                FileHashDB.processing_count.desc()
+            ).yield_per(_STREAM_BATCH_SIZE)
             
+            for dup in duplicates:
+                yield f"📄 {dup.file_name}"
+                yield f"   Processed {dup.processing_count} times"
+                yield f"   First: {dup.first_processed_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                yield f"   Last: {dup.last_processed_at.strftime('%Y-%m-%d %H:%M:%S')}"
+                yield f"   Size: {format_file_size(dup.file_size)}"
+                yield ""
+        
         except Exception as e:
-            print(f"Error analyzing duplicates: {e}")
+            yield f"Error analyzing duplicates: {e}"
     
-    def search_content(self, search_term: str) -> None:
+    @_write_lines
+    def search_content(self, search_term: str) -> Iterator[str]:
         """Search for specific content in the database."""
-        print(f"🔍 SEARCHING FOR: '{search_term}'")
-        print("-" * 40)
+        yield f"🔍 SEARCHING FOR: '{search_term}'"
+        yield "-" * 40
         
         try:
-            results = self.db_manager.search_text_content(search_term, limit=10)
+            results = self.db_manager.search_fts(search_term, limit=10)
             
             if not results:
-                print("No matches found.")
+                yield "No matches found."
                 return
             
-            print(f"Found {len(results)} matches:")
+            yield f"Found {len(results)} matches:"
             
-            for result in results:
-                print(f"📄 {result.job.input_file_name} (Page {result.page_number})")
-                print(f"   Job: {result.job.job_id}")
-                print(f"   Words: {result.word_count}, Characters: {result.text_length}")
-                
-                # Show snippet
-                text = result.text_content
-                if len(text) > 100:
-                    text = text[:100] + "..."
-                print(f"   Snippet: {text}")
-                print()
+            for result, snippet in results:
+                yield f"📄 {result.job.input_file_name} (Page {result.page_number})"
+                yield f"   Job: {result.job.job_id}"
+                yield f"   Words: {result.word_count}, Characters: {result.text_length}"
+                yield f"   Snippet: {snippet}"
+                yield ""
             
         except Exception as e:
-            print(f"Error searching content: {e}")
+            yield f"Error searching content: {e}"
 
 
 def main() -> None:
@@ -368,15 +534,15 @@ def main() -> None:
     print("This script analyzes the comprehensive data stored in the database")
     print()
     
-    analyzer = DatabaseAnalyzer()
-    
-    # Check if database exists
+    # Check if database exists before the analyzer's manager creates it
     db_path = Path.home() / ".pdf_converter" / "pdf_converter.db"
     if not db_path.exists():
         print(f"❌ Database not found: {db_path}")
         print("Please run the test_all_files.py script first to create the database.")
         return
     
+    analyzer = DatabaseAnalyzer()
+    
     try:
         # Perform comprehensive analysis
         analyzer.analyze_database()
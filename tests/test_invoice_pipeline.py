@@ -0,0 +1,57 @@
+"""Regression tests for the PDF -> structured invoice pipeline."""
+
+from pathlib import Path
+
+import pytest
+
+fitz = pytest.importorskip("pymupdf")
+pytest.importorskip("pdfplumber")
+
+from pdf_converter.models import PDFProcessingOptions, ProcessingJob
+from pdf_converter.processors.invoice_processor import InvoiceProcessor
+from pdf_converter.processors.pdf_processor import PDFProcessor
+
+
+@pytest.fixture
+def invoice_pdf(tmp_path: Path) -> Path:
+    """Write a one-page invoice whose item columns are separate text runs."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 60), "INVOICE")
+    page.insert_text((50, 80), "Date 03/15/2024")
+    rows = [
+        (120, ["10", "123456-001", "Size M", "Main Body: Cotton"]),
+        (140, ["5", "654321-002", "Size L", "Main Body: Wool"]),
+    ]
+    for y, cells in rows:
+        for x, cell in zip((50, 100, 200, 280), cells):
+            page.insert_text((x, y), cell)
+    path = tmp_path / "invoice.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _line_items(pdf_path: Path, config=None):
+    job = ProcessingJob(id="job_test", input_file=pdf_path, pdf_options=PDFProcessingOptions())
+    result = PDFProcessor(config).process(job)
+    return InvoiceProcessor().transform_to_structured_format(result.extracted_data, result.metadata)
+
+
+def test_default_text_backend_finds_line_items(invoice_pdf: Path) -> None:
+    df = _line_items(invoice_pdf)
+
+    assert df[["style_color", "size", "qty"]].values.tolist() == [
+        ["123456-001", "M", 10],
+        ["654321-002", "L", 5],
+    ]
+
+
+def test_pymupdf_text_backend_is_opt_in(invoice_pdf: Path) -> None:
+    job = ProcessingJob(id="job_test", input_file=invoice_pdf, pdf_options=PDFProcessingOptions())
+
+    default = PDFProcessor().process(job)
+    assert default.extracted_data["text"]["extraction_method"] == "pdfplumber"
+
+    opted_in = PDFProcessor({"text_backend": "pymupdf"}).process(job)
+    assert opted_in.extracted_data["text"]["extraction_method"] == "pymupdf"